@@ -39,6 +39,7 @@ for the GOcean API.
 
 '''
 import re
+from functools import lru_cache
 
 from fparser.common.readfortran import FortranStringReader
 from fparser.two import Fortran2003
@@ -53,6 +54,85 @@ from psyclone.psyir.frontend.fortran import FortranReader
 from psyclone.psyir.nodes import Container
 from psyclone.psyir.symbols import DataTypeSymbol, UnsupportedFortranType
 
+# Matches the three digits (each 0 or 1) that describe one dimension of
+# a stencil (e.g. 000, 010, 111). Compiled once here so that stencil
+# validation does not pay the cost of re-compiling it for every value
+# that is checked.
+_STENCIL_RE = re.compile(r"^[01]{3}$")
+
+
+@lru_cache(maxsize=1)
+def _const():
+    '''
+    :returns: the GOcean constants object. GOceanConstants stores its \
+        values in class variables but constructing one still has a \
+        cost, so the instance is created once and reused by the \
+        validation routines in this module.
+    :rtype: :py:class:`psyclone.domain.gocean.GOceanConstants`
+
+    '''
+    return GOceanConstants()
+
+
+@lru_cache(maxsize=None)
+def _constant_set(name):
+    '''
+    :param str name: the name of a GOceanConstants class variable \
+        holding a list of valid metadata values.
+
+    :returns: the values of the named constant as a frozenset. The \
+        result is cached so that the frequent membership tests in the \
+        metadata validators are a single hash lookup rather than a \
+        list scan.
+    :rtype: frozenset[str]
+
+    '''
+    return frozenset(getattr(_const(), name))
+
+
+@lru_cache(maxsize=2)
+def _grid_property_names(api_config):
+    '''
+    :param api_config: the GOcean API configuration section.
+    :type api_config: :py:class:`psyclone.configuration.GOceanConfig`
+
+    :returns: the lower-cased names of all grid properties defined in \
+        the supplied configuration. The result is cached (keyed on the \
+        configuration object so that a re-loaded configuration is not \
+        mixed up with a stale one) as the names are looked up for \
+        every grid-property metadata argument. Lower-casing here makes \
+        the membership test in GridArg._validate_name independent of \
+        the case used in the configuration file.
+    :rtype: frozenset[str]
+
+    '''
+    return frozenset(name.lower()
+                     for name in api_config.grid_properties.keys())
+
+
+@lru_cache(maxsize=1024)
+def _parse_derived_type(fortran_string):
+    '''Parse the supplied Fortran derived-type declaration with fparser2.
+
+    Parsing kernel metadata is expensive and the same declaration is
+    often processed many times (e.g. once per invoke that uses the
+    kernel) so the result is memoized, keyed on the declaration string.
+    Callers must therefore treat the returned parse tree as read-only.
+
+    :param str fortran_string: the metadata stored as Fortran.
+
+    :returns: an fparser2 tree for the supplied declaration.
+    :rtype: :py:class:`fparser.two.Fortran2003.Derived_Type_Def`
+
+    :raises NoMatchError: if the string does not contain a Fortran \
+        derived type.
+
+    '''
+    # Ensure the Fortran2003 parser is initialised.
+    _ = ParserFactory().create(std="f2003")
+    reader = FortranStringReader(fortran_string)
+    return Fortran2003.Derived_Type_Def(reader)
+
 
 class GOceanContainer(Container):
     '''A GOcean-specific Container. This specialises the generic Container node
@@ -194,7 +274,7 @@ class GOceanKernelMetadata():
 
         '''
         return DataTypeSymbol(
-            str(self.name), UnsupportedFortranType(self.fortran_string()))
+            self.name, UnsupportedFortranType(self.fortran_string()))
 
     @staticmethod
     def create_from_psyir(symbol):
@@ -251,11 +331,8 @@ class GOceanKernelMetadata():
         '''
         kernel_metadata = GOceanKernelMetadata()
 
-        # Ensure the Fortran2003 parser is initialised.
-        _ = ParserFactory().create(std="f2003")
-        reader = FortranStringReader(fortran_string)
         try:
-            spec_part = Fortran2003.Derived_Type_Def(reader)
+            spec_part = _parse_derived_type(fortran_string)
         except Fortran2003.NoMatchError:
             # pylint: disable=raise-missing-from
             raise ValueError(
@@ -264,18 +341,21 @@ class GOceanKernelMetadata():
 
         kernel_metadata.name = spec_part.children[0].children[1].tostr()
 
-        const = GOceanConstants()
+        const = _const()
         # Extract and store the required 'iterates_over',
-        # 'index_offset' and 'code' properties from the parse tree
+        # 'index_offset' and 'code' properties from the parse tree.
+        # The component declarations are indexed once so that each
+        # property is a dict lookup rather than a fresh tree walk.
+        component_map = GOceanKernelMetadata._component_map(spec_part)
 
         # the value of iterates over (go_all_pts, ...)
         value = GOceanKernelMetadata._get_property(
-            spec_part, "iterates_over").string
+            spec_part, "iterates_over", component_map).string
         kernel_metadata.iterates_over = value
 
         # the value of index offset (NE, ...)
         value = GOceanKernelMetadata._get_property(
-            spec_part, "index_offset").string
+            spec_part, "index_offset", component_map).string
         kernel_metadata.index_offset = value
 
         # the name of the procedure that this metadata refers to.
@@ -286,12 +366,12 @@ class GOceanKernelMetadata():
         # properties. Therefore create appropriate (GridArg, ScalarArg
         # or FieldArg) instances to capture this information.
         meta_args = GOceanKernelMetadata._get_property(
-            spec_part, "meta_args")
+            spec_part, "meta_args", component_map)
         args = walk(meta_args, Fortran2003.Ac_Value_List)
         if not args:
             raise ParseError(
                 f"meta_args should be a list, but found "
-                f"'{str(meta_args)}' in '{spec_part}'.")
+                f"'{meta_args}' in '{spec_part}'.")
 
         for meta_arg in args[0].children:
             if len(meta_arg.children[1].children) == 2:
@@ -301,11 +381,11 @@ class GOceanKernelMetadata():
             elif len(meta_arg.children[1].children) == 3:
                 # scalar and field args have 3 arguments
                 arg2 = meta_arg.children[1].children[1].string.lower()
-                if arg2 in const.VALID_FIELD_GRID_TYPES:
+                if arg2 in _constant_set("VALID_FIELD_GRID_TYPES"):
                     kernel_metadata.meta_args.append(
                         GOceanKernelMetadata.FieldArg(
                             meta_arg, kernel_metadata))
-                elif arg2 in const.VALID_SCALAR_TYPES:
+                elif arg2 in _constant_set("VALID_SCALAR_TYPES"):
                     kernel_metadata.meta_args.append(
                         GOceanKernelMetadata.ScalarArg(
                             meta_arg, kernel_metadata))
@@ -320,12 +400,57 @@ class GOceanKernelMetadata():
                 raise ParseError(
                     f"'meta_args' should have either 2 or 3 arguments, but "
                     f"found {len(meta_arg.children[1].children)} in "
-                    f"{str(meta_arg)}.")
+                    f"{meta_arg}.")
 
         return kernel_metadata
 
     @staticmethod
-    def _get_property(spec_part, property_name):
+    def _component_map(spec_part):
+        '''Internal utility that builds, in a single pass, a map from the
+        lower-cased name of each component declared in the metadata to
+        its fparser2 Component_Decl node. This allows the individual
+        properties to be looked up in constant time rather than
+        re-walking the declarations for each one.
+
+        :param spec_part: the fparser2 parse tree containing the metadata.
+        :type spec_part: :py:class:`fparser.two.Fortran2003.Derived_Type_Def`
+
+        :returns: a map from component name to its declaration.
+        :rtype: dict[str, :py:class:`fparser.two.Fortran2003.\
+            Component_Decl`]
+
+        :raises ParseError: if no declarations are found in the metadata.
+
+        '''
+        component_part = get_child(spec_part, Fortran2003.Component_Part)
+        if not component_part:
+            raise ParseError(
+                f"No declarations were found in the kernel metadata: "
+                f"'{spec_part}'.")
+        component_map = {}
+        for comp_def in component_part.children:
+            # The grammar at this point is fixed:
+            # Data_Component_Def_Stmt(type-spec, attr-spec-list,
+            # Component_Decl_List) so index straight to the declaration
+            # list rather than performing a recursive walk. Fall back
+            # to walk() for anything unexpected (e.g. a
+            # Proc_Component_Def_Stmt).
+            if isinstance(comp_def, Fortran2003.Data_Component_Def_Stmt):
+                decls = comp_def.children[2].children
+            else:
+                decls = walk(comp_def, Fortran2003.Component_Decl)
+            for component_decl in decls:
+                # Component_Decl(Name('name') ...). If a name is
+                # (invalidly) declared more than once, keep the first
+                # declaration to match the behaviour of the original
+                # linear scan.
+                component_map.setdefault(
+                    component_decl.children[0].string.lower(),
+                    component_decl)
+        return component_map
+
+    @staticmethod
+    def _get_property(spec_part, property_name, component_map=None):
         '''Internal utility that gets the property 'property_name' from an
         fparser2 tree capturing gocean metadata. It is assumed that
         the code property is part of a type bound procedure and that
@@ -335,6 +460,12 @@ class GOceanKernelMetadata():
         :type spec_part: :py:class:`fparser.two.Fortran2003.Derived_Type_Def`
         :param str property_name: the name of the property whose value \
             is being extracted from the metadata.
+        :param component_map: an optional, previously-built map of the \
+            component declarations in 'spec_part' (see \
+            :py:meth:`_component_map`). If it is not supplied then it \
+            is constructed here.
+        :type component_map: Optional[dict[str, \
+            :py:class:`fparser.two.Fortran2003.Component_Decl`]]
 
         :returns: the value of the property.
         :rtype: :py:class:`fparser.two.Fortran2003.Name | \
@@ -344,7 +475,10 @@ class GOceanKernelMetadata():
             metadata.
 
         '''
-        if property_name.lower() == "code":
+        # Lowercase the property name once rather than for every
+        # comparison below.
+        property_name = property_name.lower()
+        if property_name == "code":
             # The value of 'code' should be found in a type bound
             # procedure (after the contains keyword)
             type_bound_procedure = get_child(
@@ -369,7 +503,7 @@ class GOceanKernelMetadata():
                 raise ParseError(
                     f"Expecting the type-bound procedure binding-name to be "
                     f"'code' if there is a procedure name, but found "
-                    f"'{str(binding_name)}' in '{spec_part}'.")
+                    f"'{binding_name}' in '{spec_part}'.")
             if not procedure_name:
                 # Support the alternative metadata format that does
                 # not include 'code =>'
@@ -377,27 +511,22 @@ class GOceanKernelMetadata():
             return procedure_name
 
         # The 'property_name' will be declared within Component_Part.
-        component_part = get_child(spec_part, Fortran2003.Component_Part)
-        if not component_part:
+        if component_map is None:
+            component_map = GOceanKernelMetadata._component_map(spec_part)
+        component_decl = component_map.get(property_name)
+        if component_decl is None:
             raise ParseError(
-                f"No declarations were found in the kernel metadata: "
-                f"'{spec_part}'.")
-        # Each name/value pair will be contained within a Component_Decl
-        for component_decl in walk(component_part, Fortran2003.Component_Decl):
-            # Component_Decl(Name('name') ...)
-            name = component_decl.children[0].string
-            if name.lower() == property_name.lower():
-                # The value will be contained in a Component_Initialization
-                comp_init = get_child(
-                    component_decl, Fortran2003.Component_Initialization)
-                if not comp_init:
-                    raise ParseError(
-                        f"No value for property {property_name} was found "
-                        f"in '{spec_part}'.")
-                # Component_Initialization('=', Name('name'))
-                return comp_init.children[1]
-        raise ParseError(
-            f"'{property_name}' was not found in {str(spec_part)}.")
+                f"'{property_name}' was not found in {spec_part}.")
+        # The value will be contained in a Component_Initialization,
+        # which is always the fourth child of a Component_Decl
+        # (Name, shape, char-length, initialization).
+        comp_init = component_decl.children[3]
+        if not isinstance(comp_init, Fortran2003.Component_Initialization):
+            raise ParseError(
+                f"No value for property {property_name} was found "
+                f"in '{spec_part}'.")
+        # Component_Initialization('=', Name('name'))
+        return comp_init.children[1]
 
     def fortran_string(self):
         '''
@@ -429,10 +558,10 @@ class GOceanKernelMetadata():
         :raises ValueError: if the supplied value is invalid.
 
         '''
-        const = GOceanConstants()
-        if value.lower() not in const.VALID_ITERATES_OVER:
+        const = _const()
+        if value.lower() not in _constant_set("VALID_ITERATES_OVER"):
             raise ValueError(
-                f"Expected one of {str(const.VALID_ITERATES_OVER)} for "
+                f"Expected one of {const.VALID_ITERATES_OVER} for "
                 f"'iterates_over' metadata, but found '{value}'.")
 
     @property
@@ -485,10 +614,10 @@ class GOceanKernelMetadata():
         :raises ValueError: if the supplied value is invalid.
 
         '''
-        const = GOceanConstants()
-        if value.lower() not in const.SUPPORTED_OFFSETS:
+        const = _const()
+        if value.lower() not in _constant_set("SUPPORTED_OFFSETS"):
             raise ValueError(
-                f"Expected one of {str(const.SUPPORTED_OFFSETS)} for "
+                f"Expected one of {const.SUPPORTED_OFFSETS} for "
                 f"'index_offset' metadata, but found '{value}'.")
 
     @property
@@ -567,7 +696,7 @@ class GOceanKernelMetadata():
                 raise ParseError(
                     f"There should be 2 kernel metadata arguments for a grid "
                     f"property but found {len(arg_list.children)} in "
-                    f"{str(meta_arg)}")
+                    f"{meta_arg}")
 
             # access descriptor (read, write, ...)
             access = arg_list.children[0].string
@@ -594,7 +723,7 @@ class GOceanKernelMetadata():
             :raises ValueError: if the supplied value is invalid.
 
             '''
-            const = GOceanConstants()
+            const = _const()
             if value.lower() not in const.get_valid_access_types():
                 raise ValueError(
                     f"The first metadata entry for a grid property argument "
@@ -630,14 +759,13 @@ class GOceanKernelMetadata():
             :raises ValueError: if the supplied value is invalid.
 
             '''
-            config = Config.get()
-            api_config = config.api_conf("gocean1.0")
-            grid_property_names = list(api_config.grid_properties.keys())
-            if value.lower() not in grid_property_names:
+            api_config = Config.get().api_conf("gocean1.0")
+            if value.lower() not in _grid_property_names(api_config):
                 raise ValueError(
                     f"The second metadata entry for a grid property argument "
                     f"should have a valid name (one of "
-                    f"{grid_property_names}), but found '{value}'.")
+                    f"{list(api_config.grid_properties.keys())}), but found "
+                    f"'{value}'.")
 
         @property
         def name(self):
@@ -680,7 +808,7 @@ class GOceanKernelMetadata():
                 raise ParseError(
                     f"There should be 3 kernel metadata entries for a field "
                     f"argument, but found {len(arg_list.children)} in "
-                    f"{str(meta_arg)}.")
+                    f"{meta_arg}.")
 
             # access descriptor (go_read, go_write, ...)
             access = arg_list.children[0].string
@@ -697,13 +825,13 @@ class GOceanKernelMetadata():
                 self._stencil = None
             else:  # Stencil form (go_stencil) and stencil value
                 # (e.g. [000, 111, 000])
-                name = arg_list.children[2].children[0].string
+                stencil_arg = arg_list.children[2]
+                name = stencil_arg.children[0].string
                 self._validate_stencil_name(name)
                 self.form = name
-                stencil = []
-                for stencil_dim in arg_list.children[2].children[1].children:
-                    stencil.append(stencil_dim.children[0])
-                self._stencil = stencil
+                self._stencil = [
+                    stencil_dim.children[0]
+                    for stencil_dim in stencil_arg.children[1].children]
 
         def fortran_string(self):
             '''
@@ -726,7 +854,7 @@ class GOceanKernelMetadata():
             :raises ValueError: if the supplied value is invalid.
 
             '''
-            const = GOceanConstants()
+            const = _const()
             if value.lower() not in const.get_valid_access_types():
                 raise ValueError(
                     f"The first metadata entry for a field argument should "
@@ -761,8 +889,8 @@ class GOceanKernelMetadata():
             :raises ValueError: if the supplied value is invalid.
 
             '''
-            const = GOceanConstants()
-            if value.lower() not in const.VALID_FIELD_GRID_TYPES:
+            const = _const()
+            if value.lower() not in _constant_set("VALID_FIELD_GRID_TYPES"):
                 raise ValueError(
                     f"The second metadata entry for a field argument should "
                     f"be a recognised grid-point type descriptor (one of "
@@ -795,8 +923,10 @@ class GOceanKernelMetadata():
             :raises ValueError: if the supplied value is invalid.
 
             '''
-            const = GOceanConstants()
-            if value.lower() not in const.VALID_STENCIL_NAMES + ["go_stencil"]:
+            const = _const()
+            value_l = value.lower()
+            if (value_l not in _constant_set("VALID_STENCIL_NAMES") and
+                    value_l != "go_stencil"):
                 raise ValueError(
                     f"The third metadata entry for a field should "
                     f"be a recognised stencil descriptor (one of "
@@ -828,7 +958,7 @@ class GOceanKernelMetadata():
             :raises ValueError: if an invalid stencil name is found.
 
             '''
-            const = GOceanConstants()
+            const = _const()
             if value.lower() != const.VALID_STENCIL_NAME:
                 raise ValueError(
                     f"The third metadata entry for a field should "
@@ -859,18 +989,15 @@ class GOceanKernelMetadata():
                     f"If the third metadata entry is a stencil, it should "
                     f"contain 3 arguments, but found "
                     f"{len(value_list)} in {value_list}.")
-            # Match 3 integers which can each have the value 0 or 1
-            # (e.g. 000, 010, 111, ...)
-            pattern = re.compile("[01]{3,3}")
             for value in value_list:
                 if not isinstance(value, str):
                     raise TypeError(
                         f"Stencil entries should be strings, but found "
                         f"'{type(value).__name__}'.")
-                if not pattern.match(value):
+                if not _STENCIL_RE.match(value):
                     raise ValueError(
                         f"Stencil entries should follow the regular "
-                        f"expression [01]{{3,3}}, but found '{value}'.")
+                        f"expression [01]{{3}}, but found '{value}'.")
 
         @property
         def stencil(self):
@@ -924,7 +1051,7 @@ stable/gocean1p0.html#argument-metadata-meta-args>` \
                 raise ParseError(
                     f"There should be 3 kernel metadata entries for a scalar "
                     f"argument, but found {len(arg_list.children)} in "
-                    f"{str(meta_arg)}.")
+                    f"{meta_arg}.")
 
             # We do not use the setters here for setting the values of
             # access, datatype and form as the setters update the
@@ -964,7 +1091,7 @@ stable/gocean1p0.html#argument-metadata-meta-args>` \
             :raises ValueError: if the supplied value is invalid.
 
             '''
-            const = GOceanConstants()
+            const = _const()
             if value.lower() not in const.get_valid_access_types():
                 raise ValueError(
                     f"The first metadata entry for a scalar argument should "
@@ -998,8 +1125,8 @@ stable/gocean1p0.html#argument-metadata-meta-args>` \
             :raises ValueError: if the supplied value is invalid.
 
             '''
-            const = GOceanConstants()
-            if value.lower() not in const.VALID_SCALAR_TYPES:
+            const = _const()
+            if value.lower() not in _constant_set("VALID_SCALAR_TYPES"):
                 raise ValueError(
                     f"The second metadata entry for a scalar argument should "
                     f"be a recognised name (one of "
@@ -1031,8 +1158,8 @@ stable/gocean1p0.html#argument-metadata-meta-args>` \
             :raises ValueError: if the supplied value is invalid.
 
             '''
-            const = GOceanConstants()
-            if value.lower() not in const.VALID_STENCIL_NAMES:
+            const = _const()
+            if value.lower() not in _constant_set("VALID_STENCIL_NAMES"):
                 raise ValueError(
                     f"The third metadata entry for a scalar should "
                     f"be a recognised name (one of "
@@ -38,12 +38,26 @@ common functionality for LFRic kernel metadata.
 
 '''
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
 from fparser.common.readfortran import FortranStringReader
 from fparser.two.parser import ParserFactory
 from fparser.two.utils import NoMatchError, FortranSyntaxError
 
 
+@lru_cache(maxsize=1)
+def _setup_parser():
+    '''Sets up (and caches) the fparser2 Fortran2003 parser. The setup is
+    expensive (the factory rebuilds the whole fparser class hierarchy) so
+    it is only performed on the first call.
+
+    :returns: the fparser parser object.
+    :rtype: :py:class:`fparser.two.Fortran2003.Program`
+
+    '''
+    return ParserFactory().create(std="f2003")
+
+
 # TODO issue #1886. This class and its subclasses may have
 # commonalities with the GOcean metadata processing.
 class CommonMetadata(ABC):
@@ -120,7 +134,7 @@ class CommonMetadata(ABC):
             expected form.
 
         '''
-        _ = ParserFactory().create(std="f2003")
+        _ = _setup_parser()
         reader = FortranStringReader(fortran_string)
         match = True
         try:
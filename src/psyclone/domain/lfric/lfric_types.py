@@ -37,9 +37,8 @@
 
 '''This module contains a singleton class that manages LFRic types. '''
 
-
-from collections import namedtuple
-from dataclasses import dataclass
+import sys
+from itertools import chain
 
 from psyclone.configuration import Config
 from psyclone.domain.lfric.lfric_constants import LFRicConstants
@@ -49,6 +48,59 @@ from psyclone.psyir.symbols import (ArrayType, ContainerSymbol, DataSymbol,
                                     ImportInterface, INTEGER_TYPE, ScalarType)
 
 
+def _generic_scalar_type_init(self, precision=None):
+    '''Constructor shared by all of the generated generic scalar data
+    type classes. The function body is identical for every such class
+    (the per-class 'intrinsic' and 'default_precision' values are read
+    from class attributes), so a single function object is defined here
+    once and installed as the __init__ of each generated class.
+
+    :param precision: the precision of the scalar, defaulting to the \
+        class's default precision.
+    :type precision: Optional[:py:class:`psyclone.psyir.symbols.\
+        DataSymbol` | int]
+
+    '''
+    if not precision:
+        precision = self.default_precision
+    ScalarType.__init__(self, self.intrinsic, precision)
+
+
+def _generic_scalar_symbol_init(self, name, precision=None, **kwargs):
+    '''Constructor shared by all of the generated generic scalar data
+    symbol classes (the per-class 'type_class' is read from a class
+    attribute, see _generic_scalar_type_init).
+
+    :param str name: the name of the data symbol to create.
+    :param precision: the precision of the scalar symbol.
+    :type precision: Optional[:py:class:`psyclone.psyir.symbols.\
+        DataSymbol` | int]
+
+    '''
+    DataSymbol.__init__(self, name, self.type_class(precision=precision),
+                        **kwargs)
+
+
+def _array_type_init(self, dims):
+    '''Constructor shared by all of the generated array data type
+    classes. It verifies that the dimension argument has the number of
+    elements expected by the class (the per-class 'num_dims' and
+    'scalar_class' values are read from class attributes, so a single
+    function object serves every generated class).
+
+    :param list dims: the shape argument for the ArrayType constructor.
+
+    :raises TypeError: if the number of dimensions supplied does not \
+        match the number expected by the class.
+
+    '''
+    if len(dims) != self.num_dims:
+        raise TypeError(f"'{type(self).__name__}' expected the number "
+                        f"of supplied dimensions to be {self.num_dims}"
+                        f" but found {len(dims)}.")
+    ArrayType.__init__(self, self.scalar_class(), dims)
+
+
 class LFRicTypes:
     '''This class implements a singleton that manages LFRic types.
     Using the 'call' interface, you can query the data type for
@@ -99,8 +151,14 @@ class LFRicTypes:
             LFRicTypes.init()
 
         try:
-            return LFRicTypes._name_to_class[name]
-        except KeyError as err:
+            # The registry keys are interned (see init()) so interning the
+            # queried name allows the dict lookup to be satisfied by a
+            # pointer comparison rather than a character-by-character one
+            # (and is a no-op for literal names, which CPython interns).
+            # sys.intern() raises a TypeError for non-string names, which
+            # must result in the same InternalError as an unknown name.
+            return LFRicTypes._name_to_class[sys.intern(name)]
+        except (KeyError, TypeError) as err:
             raise InternalError(f"Unknown LFRic type '{name}'. Valid values "
                                 f"are {LFRicTypes._name_to_class.keys()}") \
                   from err
@@ -130,12 +188,29 @@ class LFRicTypes:
         LFRicTypes._create_fields()
 
         # Generate LFRic vector-field-data symbols as subclasses of
-        # field-data symbols
-        const = LFRicConstants()
-        for intrinsic in const.VALID_FIELD_INTRINSIC_TYPES:
-            name = f"{intrinsic.title()}VectorFieldDataSymbol"
-            baseclass = LFRicTypes(f"{intrinsic.title()}FieldDataSymbol")
-            LFRicTypes._name_to_class[name] = type(name, (baseclass, ), {})
+        # field-data symbols. The three field intrinsics are fixed (they
+        # are hard-coded in the field definitions in _create_fields), so
+        # the classes are created with literal names rather than by
+        # formatting them in a loop.
+        reg = LFRicTypes._name_to_class
+        reg["RealVectorFieldDataSymbol"] = type(
+            "RealVectorFieldDataSymbol",
+            (reg["RealFieldDataSymbol"], ), {})
+        reg["IntegerVectorFieldDataSymbol"] = type(
+            "IntegerVectorFieldDataSymbol",
+            (reg["IntegerFieldDataSymbol"], ), {})
+        reg["LogicalVectorFieldDataSymbol"] = type(
+            "LogicalVectorFieldDataSymbol",
+            (reg["LogicalFieldDataSymbol"], ), {})
+
+        # Intern all of the registry keys. Most of them are created with
+        # f-strings and are therefore not interned by CPython, whereas
+        # lookups are almost always made with (interned) string literals.
+        # Interning the keys means those lookups can succeed on a pointer
+        # comparison instead of comparing the strings byte by byte.
+        LFRicTypes._name_to_class = {
+            sys.intern(key): value
+            for key, value in LFRicTypes._name_to_class.items()}
 
     # ------------------------------------------------------------------------
     @staticmethod
@@ -145,31 +220,21 @@ class LFRicTypes:
         ContainerSymbol. The names are added to the global mapping.
 
         '''
-        # The first Module namedtuple argument specifies the name of the
-        # module and the second argument declares the name(s) of any symbols
-        # declared by the module.
         lfric_const = LFRicConstants()
         api_config = Config.get().api_conf("dynamo0.3")
 
-        lfric_kinds = list(api_config.precision_map.keys())
-
         constants_mod = lfric_const.UTILITIES_MOD_MAP["constants"]["module"]
-        Module = namedtuple('Module', ["name", "vars"])
-        modules = [Module(constants_mod, lfric_kinds)]
-
-        # Generate LFRic module symbols from definitions
-        for module_info in modules:
-            module_name = module_info.name.lower()
-            # Create the module (using a PSyIR ContainerSymbol)
-            LFRicTypes._name_to_class[module_name] = \
-                ContainerSymbol(module_info.name)
-            # Create the variables specified by the module (using
-            # PSyIR DataSymbols)
-            for module_var in module_info.vars:
-                var_name = module_var.upper()
-                interface = ImportInterface(LFRicTypes(module_name))
-                LFRicTypes._name_to_class[var_name] = \
-                    DataSymbol(module_var, INTEGER_TYPE, interface=interface)
+
+        # Create the module (using a PSyIR ContainerSymbol)
+        container_symbol = ContainerSymbol(constants_mod)
+        LFRicTypes._name_to_class[constants_mod.lower()] = container_symbol
+
+        # Create the precision variables declared by the module (using
+        # PSyIR DataSymbols)
+        for module_var in api_config.precision_map.keys():
+            LFRicTypes._name_to_class[module_var.upper()] = \
+                DataSymbol(module_var, INTEGER_TYPE,
+                           interface=ImportInterface(container_symbol))
 
     # ------------------------------------------------------------------------
     @staticmethod
@@ -178,27 +243,28 @@ class LFRicTypes:
         integer, real, and booleans to the global mapping.
 
         '''
-        GenericScalar = namedtuple('GenericScalar', ["name", "intrinsic",
-                                                     "precision"])
+        # Each entry specifies the base name of the datatype/symbol, its
+        # intrinsic type and its default precision.
+        get = LFRicTypes._name_to_class.__getitem__
         generic_scalar_datatypes = [
-            GenericScalar("LFRicIntegerScalar", ScalarType.Intrinsic.INTEGER,
-                          LFRicTypes("I_DEF")),
-            GenericScalar("LFRicRealScalar", ScalarType.Intrinsic.REAL,
-                          LFRicTypes("R_DEF")),
-            GenericScalar("LFRicLogicalScalar", ScalarType.Intrinsic.BOOLEAN,
-                          LFRicTypes("L_DEF"))]
+            ("LFRicIntegerScalar", ScalarType.Intrinsic.INTEGER,
+             get("I_DEF")),
+            ("LFRicRealScalar", ScalarType.Intrinsic.REAL,
+             get("R_DEF")),
+            ("LFRicLogicalScalar", ScalarType.Intrinsic.BOOLEAN,
+             get("L_DEF"))]
 
         # Generate generic LFRic scalar datatypes and symbols from definitions
-        for info in generic_scalar_datatypes:
+        for name, intrinsic, precision in generic_scalar_datatypes:
 
             # Create the generic data
-            type_name = f"{info.name}DataType"
+            type_name = f"{name}DataType"
             LFRicTypes._create_generic_scalar_data_type(type_name,
-                                                        info.intrinsic,
-                                                        info.precision)
-            type_class = LFRicTypes(type_name)
+                                                        intrinsic,
+                                                        precision)
+            type_class = get(type_name)
             # Create the generic data symbol
-            symbol_name = f"{info.name}DataSymbol"
+            symbol_name = f"{name}DataSymbol"
             LFRicTypes._create_generic_scalar_data_symbol(symbol_name,
                                                           type_class)
 
@@ -216,25 +282,14 @@ class LFRicTypes:
             should have if the precision is not specified.
 
         '''
-        # This is the constructor for the dynamically created class:
-        def __my_generic_scalar_type_init__(self, precision=None):
-            if not precision:
-                precision = self.default_precision
-            ScalarType.__init__(self, self.intrinsic, precision)
-
-        # ---------------------------------------------------------------------
-        # Create the class, and set the above function as constructor. Note
-        # that the values of 'intrinsic' and 'default_precision' must be stored
-        # in the class: the `__my_generic_scalar_type_init__` function is
-        # defined over and over again, each time with different values for
-        # intrinsic/default_precision. So when these arguments would be
-        # directly used in the constructor, they would remain at the values
-        # used the last time this function was defined, but obviously each
-        # class need the constructor using the right values. So these values
-        # are stored in the class and then used in the constructor.
+        # Create the class with the shared _generic_scalar_type_init as
+        # constructor. The values of 'intrinsic' and 'default_precision'
+        # must be stored in the class: the shared constructor is used by
+        # all of the generated classes, so it reads the per-class values
+        # from these class attributes.
         LFRicTypes._name_to_class[name] = \
             type(name, (ScalarType, ),
-                 {"__init__": __my_generic_scalar_type_init__,
+                 {"__init__": _generic_scalar_type_init,
                   "intrinsic": intrinsic,
                   "default_precision": default_precision})
 
@@ -249,19 +304,12 @@ class LFRicTypes:
         :type type_class: py:class:`pyclone.psyir.datatypes.ScalarType`
 
         '''
-        # This is the constructor for the dynamically created class:
-        def __my_generic_scalar_symbol_init__(self, name, precision=None,
-                                              **kwargs):
-            DataSymbol.__init__(self, name,
-                                self.type_class(precision=precision),
-                                **kwargs)
-
-        # ---------------------------------------------------------------------
-        # Create the class, set the constructor and store the ScalarType as
-        # an attribute, so it can be accessed in the constructor.
+        # Create the class with the shared _generic_scalar_symbol_init
+        # as constructor, and store the ScalarType as an attribute so it
+        # can be accessed by that constructor.
         LFRicTypes._name_to_class[name] = \
             type(name, (DataSymbol, ),
-                 {"__init__": __my_generic_scalar_symbol_init__,
+                 {"__init__": _generic_scalar_symbol_init,
                   "type_class": type_class})
 
     # ------------------------------------------------------------------------
@@ -307,38 +355,36 @@ class LFRicTypes:
         LFRicIntegerScalarData)
 
         '''
-        # The Scalar namedtuple has 3 properties: the first
-        # determines the names of the resultant datatype and datasymbol
-        # classes, the second references the generic scalar type
-        # classes declared above and the third specifies any
-        # additional class properties that should be declared in the generated
-        # datasymbol class.
-        Scalar = namedtuple('Scalar', ["name", "generic_type_name",
-                                       "properties"])
+        # Each entry has 3 fields: the first determines the names of the
+        # resultant datatype and datasymbol classes, the second
+        # references the generic scalar type classes declared above and
+        # the third specifies any additional class properties that
+        # should be declared in the generated datasymbol class.
         specific_scalar_datatypes = [
-            Scalar("CellPosition", "LFRicIntegerScalarData", []),
-            Scalar("MeshHeight", "LFRicIntegerScalarData", []),
-            Scalar("NumberOfCells", "LFRicIntegerScalarData", []),
-            Scalar("NumberOfDofs", "LFRicIntegerScalarData", ["fs"]),
-            Scalar("NumberOfUniqueDofs", "LFRicIntegerScalarData", ["fs"]),
-            Scalar("NumberOfFaces", "LFRicIntegerScalarData", []),
-            Scalar("NumberOfEdges", "LFRicIntegerScalarData", []),
-            Scalar("NumberOfQrPointsInXy", "LFRicIntegerScalarData", []),
-            Scalar("NumberOfQrPointsInZ", "LFRicIntegerScalarData", []),
-            Scalar("NumberOfQrPointsInFaces", "LFRicIntegerScalarData", []),
-            Scalar("NumberOfQrPointsInEdges", "LFRicIntegerScalarData", [])]
-
-        for info in specific_scalar_datatypes:
-            type_name = f"{info.name}DataType"
+            ("CellPosition", "LFRicIntegerScalarData", []),
+            ("MeshHeight", "LFRicIntegerScalarData", []),
+            ("NumberOfCells", "LFRicIntegerScalarData", []),
+            ("NumberOfDofs", "LFRicIntegerScalarData", ["fs"]),
+            ("NumberOfUniqueDofs", "LFRicIntegerScalarData", ["fs"]),
+            ("NumberOfFaces", "LFRicIntegerScalarData", []),
+            ("NumberOfEdges", "LFRicIntegerScalarData", []),
+            ("NumberOfQrPointsInXy", "LFRicIntegerScalarData", []),
+            ("NumberOfQrPointsInZ", "LFRicIntegerScalarData", []),
+            ("NumberOfQrPointsInFaces", "LFRicIntegerScalarData", []),
+            ("NumberOfQrPointsInEdges", "LFRicIntegerScalarData", [])]
+
+        get = LFRicTypes._name_to_class.__getitem__
+        for name, generic_type_name, properties in specific_scalar_datatypes:
+            type_name = f"{name}DataType"
             LFRicTypes._name_to_class[type_name] = \
                 type(type_name,
-                     (LFRicTypes(f"{info.generic_type_name}Type"), ),
+                     (get(f"{generic_type_name}Type"), ),
                      {})
 
-            symbol_name = f"{info.name}DataSymbol"
-            base_class = LFRicTypes(f"{info.generic_type_name}Symbol")
+            symbol_name = f"{name}DataSymbol"
+            base_class = get(f"{generic_type_name}Symbol")
             LFRicTypes._create_scalar_data_type(symbol_name, base_class,
-                                                info.properties)
+                                                properties)
 
     # ------------------------------------------------------------------------
     @staticmethod
@@ -355,44 +401,30 @@ class LFRicTypes:
 
         '''
         # ---------------------------------------------------------------------
-        # This is the __init__ function for the newly declared scalar data
-        # types, which will be added as an attribute for the newly created
-        # class. It parses the additional positional and keyword arguments
-        # and sets them as attributes.
-
-        def __my_scalar_init__(self, name, *args, **kwargs):
-            # Set all the positional arguments as attributes:
-            for i, arg in enumerate(args):
-                setattr(self, self.parameters[i], arg)
-            # Now handle the keyword arguments: any keyword arguments
-            # that are declared as parameter will be set as attribute,
-            # anything else will be passed to the constructor of the
-            # base class.
-            remaining_kwargs = {}
-            for key, value in kwargs.items():
-                # It is one of the additional parameters, set it as
-                # attribute:
-                if key in self.parameters:
-                    setattr(self, key, value)
-                else:
-                    # Otherwise add it as keyword parameter for the
-                    # base class constructor
-                    remaining_kwargs[key] = value
-            self.base_class.__init__(self, name, **remaining_kwargs)
-
-        # ----------------------------------------------------------------
-
-        # Now create the actual class. We need to keep a copy of the parameters
-        # of this class as attributes, otherwise the __my_scalar_init__
-        # function (there is only one, which gets re-defined over and over)
-        # will all be using the values for base_class and parameters that were
-        # active the last time the function was defined. E.g. the
-        # __my_scalar_init__ function set for CellPosition is the same as the
-        # function set in NumberOfQrPointsInEdges (i.e. based on the same
-        # values for base_class and parameters).
+        # Generate a specialised __init__ for the new class (using the
+        # same exec-a-template technique as the standard library's
+        # namedtuple). The additional parameters become explicit keyword
+        # arguments that are stored with straight-line attribute
+        # assignments, which avoids looping over args/kwargs and
+        # filtering a 'remaining' dict on every instantiation. Anything
+        # not declared as a parameter is passed on to the constructor of
+        # the base class.
+        arg_list = "".join(f", {param}=None" for param in parameters)
+        body = "".join(f"    self.{param} = {param}\n"
+                       for param in parameters)
+        source = (f"def __init__(self, name{arg_list}, **kwargs):\n"
+                  f"{body}"
+                  f"    base_class.__init__(self, name, **kwargs)\n")
+        namespace = {"base_class": base_class}
+        # pylint: disable-next=exec-used
+        exec(compile(source, "<lfric_types>", "exec"), namespace)
+
+        # Now create the actual class. The base_class and parameters are
+        # kept as class attributes for introspection (as in the previous
+        # generic-constructor implementation).
         LFRicTypes._name_to_class[class_name] = \
             type(class_name, (base_class, ),
-                 {"__init__": __my_scalar_init__,
+                 {"__init__": namespace["__init__"],
                   "base_class": base_class,
                   "parameters": parameters})
 
@@ -407,31 +439,20 @@ class LFRicTypes:
         # list because they are used to create vector field datatypes and
         # symbols.
 
-        @dataclass(frozen=True)
-        class Array:
-            '''
-            Holds the properties of an LFRic array type, used when generating
-            DataSymbol and DataSymbolType classes.
-
-            :param name: the base name to use for the datatype and datasymbol.
-            :param scalar_type: the name of the LFRic scalar type that this is
-                                an array of.
-            :param dims: textual description of each of the dimensions.
-            :param properties: names of additional class properties that should
-                               be declared in the generated datasymbol class.
-            '''
-            name: str
-            scalar_type: str
-            dims: list        # list[str] notation supported in Python 3.9+
-            properties: list  # ditto
-
+        # Each entry holds the properties of an LFRic array type, used
+        # when generating DataSymbol and DataSymbolType classes:
+        # - the base name to use for the datatype and datasymbol;
+        # - the name of the LFRic scalar type that this is an array of;
+        # - a textual description of each of the dimensions;
+        # - the names of additional class properties that should be
+        #   declared in the generated datasymbol class.
         field_datatypes = [
-            Array("RealField", "LFRicRealScalarDataType",
-                  ["number of unique dofs"], ["fs"]),
-            Array("IntegerField", "LFRicIntegerScalarDataType",
-                  ["number of unique dofs"], ["fs"]),
-            Array("LogicalField", "LFRicLogicalScalarDataType",
-                  ["number of unique dofs"], ["fs"])]
+            ("RealField", "LFRicRealScalarDataType",
+             ["number of unique dofs"], ["fs"]),
+            ("IntegerField", "LFRicIntegerScalarDataType",
+             ["number of unique dofs"], ["fs"]),
+            ("LogicalField", "LFRicLogicalScalarDataType",
+             ["number of unique dofs"], ["fs"])]
 
         # TBD: #918 the dimension datatypes and their ordering is captured in
         # field_datatypes and array_datatypes but is not stored in the
@@ -449,55 +470,57 @@ class LFRicTypes:
         # function space attribute and the two function spaces must be
         # the same. This is not currently checked.
         array_datatypes = [
-            Array("Operator", "LFRicRealScalarDataType",
-                  ["number of dofs", "number of dofs", "number of cells"],
-                  ["fs_from", "fs_to"]),
-            Array("DofMap", "LFRicIntegerScalarDataType",
-                  ["number of dofs"], ["fs"]),
-            Array("BasisFunctionQrXyoz", "LFRicRealScalarDataType",
-                  [LFRicTypes("LFRicDimension"), "number of dofs",
-                   "number of qr points in xy",
-                   "number of qr points in z"], ["fs"]),
-            Array("BasisFunctionQrFace", "LFRicRealScalarDataType",
-                  [LFRicTypes("LFRicDimension"), "number of dofs",
-                   "number of qr points in faces",
-                   "number of faces"], ["fs"]),
-            Array("BasisFunctionQrEdge", "LFRicRealScalarDataType",
-                  [LFRicTypes("LFRicDimension"), "number of dofs",
-                   "number of qr points in edges",
-                   "number of edges"], ["fs"]),
-            Array("DiffBasisFunctionQrXyoz", "LFRicRealScalarDataType",
-                  [LFRicTypes("LFRicDimension"), "number of dofs",
-                   "number of qr points in xy",
-                   "number of qr points in z"], ["fs"]),
-            Array("DiffBasisFunctionQrFace", "LFRicRealScalarDataType",
-                  [LFRicTypes("LFRicDimension"), "number of dofs",
-                   "number of qr points in faces",
-                   "number of faces"], ["fs"]),
-            Array("DiffBasisFunctionQrEdge", "LFRicRealScalarDataType",
-                  [LFRicTypes("LFRicDimension"), "number of dofs",
-                   "number of qr points in edges", "number of edges"], ["fs"]),
-            Array("QrWeightsInXy", "LFRicRealScalarDataType",
-                  ["number of qr points in xy"], []),
-            Array("QrWeightsInZ", "LFRicRealScalarDataType",
-                  ["number of qr points in z"], []),
-            Array("QrWeightsInFaces", "LFRicRealScalarDataType",
-                  ["number of qr points in faces"], []),
-            Array("QrWeightsInEdges", "LFRicRealScalarDataType",
-                  ["number of qr points in edges"], []),
-            Array("VerticalBoundaryDofMask", "LFRicIntegerScalarDataType",
-                  ["number of dofs", LFRicTypes("LFRicDimension")], [])
+            ("Operator", "LFRicRealScalarDataType",
+             ["number of dofs", "number of dofs", "number of cells"],
+             ["fs_from", "fs_to"]),
+            ("DofMap", "LFRicIntegerScalarDataType",
+             ["number of dofs"], ["fs"]),
+            ("BasisFunctionQrXyoz", "LFRicRealScalarDataType",
+             [LFRicTypes("LFRicDimension"), "number of dofs",
+              "number of qr points in xy",
+              "number of qr points in z"], ["fs"]),
+            ("BasisFunctionQrFace", "LFRicRealScalarDataType",
+             [LFRicTypes("LFRicDimension"), "number of dofs",
+              "number of qr points in faces",
+              "number of faces"], ["fs"]),
+            ("BasisFunctionQrEdge", "LFRicRealScalarDataType",
+             [LFRicTypes("LFRicDimension"), "number of dofs",
+              "number of qr points in edges",
+              "number of edges"], ["fs"]),
+            ("DiffBasisFunctionQrXyoz", "LFRicRealScalarDataType",
+             [LFRicTypes("LFRicDimension"), "number of dofs",
+              "number of qr points in xy",
+              "number of qr points in z"], ["fs"]),
+            ("DiffBasisFunctionQrFace", "LFRicRealScalarDataType",
+             [LFRicTypes("LFRicDimension"), "number of dofs",
+              "number of qr points in faces",
+              "number of faces"], ["fs"]),
+            ("DiffBasisFunctionQrEdge", "LFRicRealScalarDataType",
+             [LFRicTypes("LFRicDimension"), "number of dofs",
+              "number of qr points in edges", "number of edges"], ["fs"]),
+            ("QrWeightsInXy", "LFRicRealScalarDataType",
+             ["number of qr points in xy"], []),
+            ("QrWeightsInZ", "LFRicRealScalarDataType",
+             ["number of qr points in z"], []),
+            ("QrWeightsInFaces", "LFRicRealScalarDataType",
+             ["number of qr points in faces"], []),
+            ("QrWeightsInEdges", "LFRicRealScalarDataType",
+             ["number of qr points in edges"], []),
+            ("VerticalBoundaryDofMask", "LFRicIntegerScalarDataType",
+             ["number of dofs", LFRicTypes("LFRicDimension")], [])
             ]
 
-        for array_type in array_datatypes + field_datatypes:
-            name = f"{array_type.name}DataType"
+        get = LFRicTypes._name_to_class.__getitem__
+        for base_name, scalar_type, dims, properties in chain(
+                array_datatypes, field_datatypes):
+            name = f"{base_name}DataType"
             LFRicTypes._create_array_data_type_class(
-                name, len(array_type.dims), LFRicTypes(array_type.scalar_type))
+                name, len(dims), get(scalar_type))
 
-            my_datatype_class = LFRicTypes(name)
-            name = f"{array_type.name}DataSymbol"
+            my_datatype_class = get(name)
+            name = f"{base_name}DataSymbol"
             LFRicTypes._create_array_data_symbol_class(name, my_datatype_class,
-                                                       array_type.properties)
+                                                       properties)
 
     # ------------------------------------------------------------------------
     @staticmethod
@@ -510,30 +533,14 @@ class LFRicTypes:
         :type scalar_type: :py:class:`psyclone.psyir.datatypes.DataType`
 
         '''
-        # ---------------------------------------------------------------------
-        # This is the constructor for the newly declared classes, which
-        # verifies that the dimension argument has the expected number of
-        # elements.
-        def __my_type_init__(self, dims):
-            '''
-            Constructor for the array data type class.
-
-            :param list dims: the shape argument for the ArrayType constructor.
-
-            '''
-            if len(dims) != self.num_dims:
-                raise TypeError(f"'{type(self).__name__}' expected the number "
-                                f"of supplied dimensions to be {self.num_dims}"
-                                f" but found {len(dims)}.")
-            ArrayType.__init__(self, self.scalar_class(), dims)
-
-        # ---------------------------------------------------------------------
-        # Create the class, and set the constructor. Store the scalar_type
-        # and num_dims as attributes, so they are indeed different for all
-        # the various classes created here.
+        # Create the class with the shared _array_type_init as
+        # constructor. Store the scalar_type and num_dims as class
+        # attributes, so they are indeed different for all the various
+        # classes created here (the shared constructor reads them from
+        # the class).
         LFRicTypes._name_to_class[name] = \
             type(name, (ArrayType, ),
-                 {"__init__": __my_type_init__,
+                 {"__init__": _array_type_init,
                   "scalar_class": scalar_type,
                   "num_dims": num_dims})
 
@@ -553,43 +560,27 @@ class LFRicTypes:
 
         '''
         # ---------------------------------------------------------------------
-        def __my_symbol_init__(self, name, dims, *args, **kwargs):
-            '''This is the __init__ function for the newly declared array data
-            type classes. It sets the required arguments automatically as
-            attributes of the class.
-
-            :param str name: the name of the data symbol to create.
-            :param list dims: the shape argument for the ArrayType constructor.
-            :param *args: other required positional parameters.
-            :param **kwargs: other required keyword parameters.
-            '''
-            # Set all the positional arguments as attributes:
-            for i, arg in enumerate(args):
-                setattr(self, self.parameters[i], arg)
-            # Now handle the keyword arguments: any keyword arguments
-            # that are declared as parameter will be set as attribute,
-            # anything else will be passed to the constructor of the
-            # base class.
-            remaining_kwargs = {}
-            for key, value in kwargs.items():
-                # It is one of the additional parameters, set it as
-                # attribute:
-                if key in self.parameters:
-                    setattr(self, key, value)
-                else:
-                    # Otherwise add it as keyword parameter for the
-                    # base class constructor
-                    remaining_kwargs[key] = value
-            DataSymbol.__init__(self, name, self.datatype_class(dims),
-                                **remaining_kwargs)
-        # ----------------------------------------------------------------
-
-        # Now create the actual class. We need to keep a copy of the parameters
-        # of this class as attributes, otherwise they would be shared among the
-        # several instances of the __my_symbol_init__function: this affects the
-        # required arguments (array_type.properties) and scalar class:
+        # Generate a specialised __init__ for the new class (see
+        # _create_scalar_data_type for details of the technique). The
+        # additional parameters become explicit keyword arguments set
+        # with straight-line attribute assignments and any other keyword
+        # arguments are passed on to the DataSymbol constructor.
+        arg_list = "".join(f", {param}=None" for param in parameters)
+        body = "".join(f"    self.{param} = {param}\n"
+                       for param in parameters)
+        source = (f"def __init__(self, name, dims{arg_list}, **kwargs):\n"
+                  f"{body}"
+                  f"    DataSymbol.__init__(self, name, "
+                  f"self.datatype_class(dims), **kwargs)\n")
+        namespace = {"DataSymbol": DataSymbol}
+        # pylint: disable-next=exec-used
+        exec(compile(source, "<lfric_types>", "exec"), namespace)
+
+        # Now create the actual class. The datatype_class and parameters
+        # are kept as class attributes; the former is read by the
+        # generated constructor, which is different for every class.
         LFRicTypes._name_to_class[name] = \
             type(name, (DataSymbol, ),
-                 {"__init__": __my_symbol_init__,
+                 {"__init__": namespace["__init__"],
                   "datatype_class": datatype_class,
                   "parameters": parameters})
@@ -85,6 +85,10 @@ class CreateNemoPSyTrans(Transformation):
     been converted into a `NemoInvokeSchedule`.
 
     """
+    # The invoke-schedule transformation is stateless so a single,
+    # shared instance avoids constructing a new one for every apply().
+    _invoke_trans = CreateNemoInvokeScheduleTrans()
+
     @property
     def name(self):
         '''
@@ -137,11 +141,9 @@ class CreateNemoPSyTrans(Transformation):
         '''
         self.validate(psyir, options=options)
 
-        invoke_trans = CreateNemoInvokeScheduleTrans()
-
         # Transform any Routines into NemoInvokeSchedules.
         for routine in psyir.walk(Routine):
-            invoke_trans.apply(routine)
+            self._invoke_trans.apply(routine)
 
 
 # For AutoAPI documentation generation
@@ -39,14 +39,20 @@ and the fparser tree (if requested), and information about any routines it
 includes, and external symbol usage.
 '''
 
+import atexit
+import json
 import os
+import re
+import weakref
+from functools import lru_cache
 
 from fparser.common.readfortran import FortranStringReader
-from fparser.two.Fortran2003 import (Function_Subprogram, Interface_Block,
-                                     Interface_Stmt, Procedure_Stmt,
-                                     Subroutine_Subprogram, Use_Stmt)
+from fparser.two.Fortran2003 import (Function_Subprogram,
+                                     Interface_Block, Interface_Stmt, Name,
+                                     Procedure_Stmt, Subroutine_Subprogram,
+                                     Use_Stmt)
 from fparser.two.parser import ParserFactory
-from fparser.two.utils import FortranSyntaxError, walk
+from fparser.two.utils import FortranSyntaxError, StmtBase, walk
 
 from psyclone.errors import InternalError, PSycloneError
 from psyclone.psyir.frontend.fparser2 import Fparser2Reader
@@ -54,6 +60,232 @@ from psyclone.psyir.nodes import Container, FileContainer
 from psyclone.psyir.symbols import SymbolError
 
 
+# The file in which the import (use-statement) information of analysed
+# modules is cached across PSyclone runs (see
+# ModuleInfo._extract_import_information). As for the parse-tree cache in
+# the Fortran frontend, it can be disabled by setting the
+# PSYCLONE_PARSE_CACHE environment variable to '0'.
+_USE_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "psyclone", "use_stmts.json")
+
+# The in-process copy of the on-disk cache, loaded lazily on first use. It
+# maps "realpath;mtime_ns;size" of a source file to the cached import
+# information.
+_use_cache = None
+
+# Whether the in-process cache holds entries that have not yet been
+# written back to disk (see _schedule_use_cache_save).
+_use_cache_dirty = False
+
+
+# ============================================================================
+def _load_use_cache():
+    '''Lazily loads (and returns) the on-disk cache of import information.
+    An unreadable or corrupt cache file simply results in an empty cache.
+
+    :returns: the mapping of file keys to cached import information.
+    :rtype: dict[str, dict]
+
+    '''
+    # pylint: disable=global-statement
+    global _use_cache
+    if _use_cache is None:
+        try:
+            with open(_USE_CACHE_FILE, "r", encoding="utf-8") as file_in:
+                _use_cache = json.load(file_in)
+        except (OSError, ValueError):
+            _use_cache = {}
+    return _use_cache
+
+
+# ============================================================================
+def _schedule_use_cache_save():
+    '''Marks the in-process import-information cache as holding unsaved
+    entries and registers _save_use_cache to run at interpreter exit.
+    Writing once per process (rather than after every newly-analysed
+    module) keeps a cold run over N modules from re-serialising the
+    whole cache N times.
+
+    '''
+    # pylint: disable=global-statement
+    global _use_cache_dirty
+    if not _use_cache_dirty:
+        _use_cache_dirty = True
+        atexit.register(_save_use_cache)
+
+
+# ============================================================================
+def _save_use_cache():
+    '''Writes the in-process import-information cache back to disk, if it
+    has unsaved entries. The on-disk file is re-read and merged with the
+    in-process entries first, so that concurrent PSyclone processes only
+    ever overwrite each other at the granularity of a single entry. This
+    is best effort: the cache is written to a temporary file and then
+    moved into place (so other processes never see a partial file) and
+    any failure to write is ignored.
+
+    '''
+    # pylint: disable=global-statement
+    global _use_cache_dirty
+    if not _use_cache_dirty:
+        return
+    _use_cache_dirty = False
+    try:
+        merged = {}
+        try:
+            with open(_USE_CACHE_FILE, "r", encoding="utf-8") as file_in:
+                merged = json.load(file_in)
+        except (OSError, ValueError):
+            pass
+        merged.update(_use_cache)
+        os.makedirs(os.path.dirname(_USE_CACHE_FILE), exist_ok=True)
+        tmp_file = f"{_USE_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as file_out:
+            json.dump(merged, file_out)
+        os.replace(tmp_file, _USE_CACHE_FILE)
+    except OSError:
+        pass
+
+
+# Regular expressions used by _extract_use_information to extract use
+# statements lexically, without invoking fparser. _USE_CANDIDATE_RE
+# identifies lines that could be use statements; _USE_LINE_RE then matches
+# the (common) forms that can be handled without a parser.
+_USE_CANDIDATE_RE = re.compile(r"^[ \t]*use\b", re.IGNORECASE)
+_USE_LINE_RE = re.compile(
+    r"^[ \t]*use[ \t]*(?:,[ \t]*(non_intrinsic|intrinsic)[ \t]*)?"
+    r"(?:::)?[ \t]*(\w+)[ \t]*(?:,[ \t]*only[ \t]*:(.*))?$",
+    re.IGNORECASE)
+
+
+# ============================================================================
+def _strip_trailing_comment(line):
+    '''Removes any trailing comment from the supplied free-form source
+    line, leaving '!' characters inside character literals untouched.
+
+    :param str line: the source line to strip.
+
+    :returns: the line with any trailing comment removed, or None if the
+        line ends inside a character literal (i.e. a continued string).
+    :rtype: Optional[str]
+
+    '''
+    quote = None
+    for idx, char in enumerate(line):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char == "!":
+            return line[:idx]
+        elif char in "'\"":
+            quote = char
+    return None if quote else line
+
+
+# ============================================================================
+def _extract_use_information(source):
+    '''Extracts the used modules and the symbols imported from them from
+    the supplied source code using regular expressions only, i.e. without
+    the cost of a full fparser parse. Fortran use statements have a simple
+    lexical structure, so this handles the overwhelmingly common forms
+    directly; anything unusual (renames outside an only list, operator or
+    assignment specifiers, unresolved continuations, lines that merely
+    start with 'use', ...) makes the function return None, in which case
+    the caller falls back to fparser. The values returned for the handled
+    forms are identical to those that the fparser-based extraction
+    produces.
+
+    :param str source: the source code to scan.
+
+    :returns: the set of used module names and the mapping of module name
+        to the set of symbols imported from it, or None if the source
+        must be parsed by fparser instead.
+    :rtype: Optional[tuple[set[str], dict[str, set[str]]]]
+
+    '''
+    # Strip trailing comments line by line *before* joining continuation
+    # lines, so that a '&' inside a comment is not mistaken for a
+    # continuation. A line that ends inside a character literal (i.e. a
+    # continued string) and a ';' (which may hide a use statement inside
+    # a compound line) both trigger the fparser fallback.
+    lines = []
+    for line in source.splitlines():
+        line = _strip_trailing_comment(line)
+        if line is None or ";" in line:
+            return None
+        lines.append(line)
+    source = "\n".join(lines)
+    # Join continuation lines.
+    source = re.sub(r"&[ \t]*\n[ \t]*&", "", source)
+    source = re.sub(r"&[ \t]*\n", " ", source)
+
+    used_modules = set()
+    used_symbols = {}
+    for line in source.splitlines():
+        if not _USE_CANDIDATE_RE.match(line):
+            continue
+        match = _USE_LINE_RE.match(line.rstrip())
+        if not match:
+            return None
+        nature, mod_name, only_list = match.groups()
+        if nature and nature.lower() == "intrinsic":
+            continue
+        used_modules.add(mod_name)
+        all_symbols = set()
+        if only_list is not None:
+            if not only_list.strip():
+                return None
+            for item in only_list.split(","):
+                item = re.sub(r"[ \t]+", " ", item.strip())
+                if not item or "(" in item:
+                    return None
+                # Normalise any rename to the way fparser renders it.
+                all_symbols.add(re.sub(r"[ \t]*=>[ \t]*", " => ", item))
+        used_symbols[mod_name] = all_symbols
+    return (used_modules, used_symbols)
+
+
+# ============================================================================
+def _find_use_stmts(node):
+    '''A generator yielding all Use_Stmt nodes in the supplied parse (sub-)
+    tree in preorder. Unlike fparser's generic `walk`, this prunes the
+    search at statement level: a use statement cannot appear inside
+    another statement, so there is no point visiting the expressions and
+    literals each statement contains. Constructs are still recursed into,
+    since an F2008 BLOCK construct may contain use statements in its
+    specification part.
+
+    :param node: the parse tree (or node thereof) to search.
+    :type node: :py:class:`fparser.two.utils.Base`
+
+    :returns: each Use_Stmt node found.
+    :rtype: Iterator[:py:class:`fparser.two.Fortran2003.Use_Stmt`]
+
+    '''
+    for child in getattr(node, "children", ()):
+        if isinstance(child, Use_Stmt):
+            yield child
+        elif not isinstance(child, StmtBase):
+            yield from _find_use_stmts(child)
+
+
+# ============================================================================
+@lru_cache(maxsize=4)
+def _get_parser(std):
+    '''Creates (and caches) the fparser parser for the specified Fortran
+    standard. Creating a parser is expensive (the factory rebuilds the
+    whole fparser class hierarchy), so the result is shared between all
+    ModuleInfo instances.
+
+    :param str std: the Fortran standard to use, e.g. "f2008".
+
+    :returns: the fparser parser object.
+    :rtype: :py:class:`fparser.two.Fortran2003.Program`
+
+    '''
+    return ParserFactory().create(std=std)
+
+
 # ============================================================================
 class ModuleInfoError(PSycloneError):
     '''
@@ -83,7 +315,34 @@ class ModuleInfo:
 
     '''
 
+    # A project can contain thousands of modules, each with a ModuleInfo
+    # instance, so the per-instance dict is replaced with slots. The
+    # __weakref__ slot is required for the weak references held by
+    # _instances below.
+    __slots__ = ("__weakref__", "_name", "_filename", "_source_code",
+                 "_parse_tree", "_psyir", "_used_modules",
+                 "_used_symbols_from_module", "_routine_names",
+                 "_generic_interfaces", "_processor")
+
+    # Map of (name, real filename) to the existing instance (if any), so
+    # that creating a ModuleInfo for a module that has already been seen
+    # returns the existing object - and with it all of its cached data -
+    # rather than re-reading and re-parsing the file.
+    _instances = weakref.WeakValueDictionary()
+
+    def __new__(cls, name, filename):
+        key = (name, os.path.realpath(filename))
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instances[key] = instance
+        return instance
+
     def __init__(self, name, filename):
+        # __init__ is also invoked when __new__ returns an existing,
+        # fully-initialised instance - do not wipe its caches.
+        if hasattr(self, "_name"):
+            return
         self._name = name
         self._filename = filename
         # A cache for the source code:
@@ -117,7 +376,9 @@ class ModuleInfo:
         # TODO #2435: To be changed once we have support for interfaces
         self._generic_interfaces = {}
 
-        self._processor = Fparser2Reader()
+        # The fparser2-to-PSyIR processor. Constructing one is not free
+        # so it is only created when get_psyir() first needs it.
+        self._processor = None
 
     # ------------------------------------------------------------------------
     @property
@@ -151,8 +412,15 @@ class ModuleInfo:
         '''
         if self._source_code is None:
             try:
-                with open(self._filename, "r", encoding='utf-8') as file_in:
-                    self._source_code = file_in.read()
+                # Read the file as bytes and decode in one go - for the
+                # multi-MB sources this is noticeably cheaper than the
+                # incremental decoding done by a text-mode read. The
+                # replace() calls mirror the universal-newline translation
+                # that text mode performed.
+                with open(self._filename, "rb") as file_in:
+                    self._source_code = (
+                        file_in.read().decode("utf-8")
+                        .replace("\r\n", "\n").replace("\r", "\n"))
             except FileNotFoundError as err:
                 raise ModuleInfoError(
                     f"Could not find file '{self._filename}' when trying to "
@@ -177,7 +445,7 @@ class ModuleInfo:
             self._routine_names = set()
 
             reader = FortranStringReader(self.get_source_code())
-            parser = ParserFactory().create(std="f2008")
+            parser = _get_parser("f2008")
             self._parse_tree = parser(reader)
 
             # First collect information about all subroutines/functions.
@@ -246,33 +514,79 @@ class ModuleInfo:
         self._used_modules = set()
         self._used_symbols_from_module = {}
 
-        try:
-            parse_tree = self.get_parse_tree()
-        except FortranSyntaxError:
-            # TODO #11: Add proper logging
-            # TODO #2120: Handle error
-            print(f"[ModuleInfo._extract_import_information] Syntax error "
-                  f"parsing '{self._filename} - ignored")
-            # Hide syntax errors
-            return
-        for use in walk(parse_tree, Use_Stmt):
-            # Ignore intrinsic modules:
-            if str(use.items[0]) == "INTRINSIC":
-                continue
-
-            mod_name = str(use.items[2])
-            self._used_modules.add(mod_name)
-            all_symbols = set()
-
-            only_list = use.items[4]
-            # If there is no only_list, then the set of symbols
-            # will stay empty
-            if only_list:
-                # Parse the only list:
-                for symbol in only_list.children:
-                    all_symbols.add(str(symbol))
-
-            self._used_symbols_from_module[mod_name] = all_symbols
+        # The import information only depends on the file contents, so it
+        # is cached on disk keyed on the file's path, modification time
+        # and size. On a hit the fparser parse - by far the dominant cost
+        # of this method - is skipped entirely.
+        cache_key = None
+        if os.environ.get("PSYCLONE_PARSE_CACHE", "1") != "0":
+            try:
+                stat = os.stat(self._filename)
+                cache_key = (f"{os.path.realpath(self._filename)};"
+                             f"{stat.st_mtime_ns};{stat.st_size}")
+            except OSError:
+                pass
+        if cache_key:
+            cached = _load_use_cache().get(cache_key)
+            if cached is not None:
+                self._used_modules = set(cached["modules"])
+                self._used_symbols_from_module = {
+                    mod_name: set(symbols)
+                    for mod_name, symbols in cached["symbols"].items()}
+                return
+
+        # Fast path: try to extract the information lexically, which
+        # avoids parsing the whole file with fparser. This only handles
+        # the common forms of use statement and returns None when the
+        # source must be properly parsed instead.
+        use_info = _extract_use_information(self.get_source_code())
+        if use_info is not None:
+            self._used_modules, self._used_symbols_from_module = use_info
+        else:
+            try:
+                parse_tree = self.get_parse_tree()
+            except FortranSyntaxError:
+                # TODO #11: Add proper logging
+                # TODO #2120: Handle error
+                print(f"[ModuleInfo._extract_import_information] Syntax error "
+                      f"parsing '{self._filename} - ignored")
+                # Hide syntax errors
+                return
+            for use in _find_use_stmts(parse_tree):
+                # Ignore intrinsic modules. The module nature (if any) is
+                # stored upper-cased, so it can be compared directly
+                # without re-rendering the node with str():
+                nature = use.items[0]
+                if nature is not None and nature.string == "INTRINSIC":
+                    continue
+
+                # The module name is a Name, whose string attribute holds
+                # the name as written in the source:
+                mod_name = use.items[2].string
+                self._used_modules.add(mod_name)
+                all_symbols = set()
+
+                only_list = use.items[4]
+                # If there is no only_list, then the set of symbols
+                # will stay empty
+                if only_list:
+                    # Parse the only list. Plain names are taken from the
+                    # node directly; anything else (e.g. a rename) is
+                    # rendered by str() as before:
+                    for symbol in only_list.children:
+                        if isinstance(symbol, Name):
+                            all_symbols.add(symbol.string)
+                        else:
+                            all_symbols.add(str(symbol))
+
+                self._used_symbols_from_module[mod_name] = all_symbols
+
+        if cache_key:
+            _load_use_cache()[cache_key] = {
+                "modules": sorted(self._used_modules),
+                "symbols": {mod_name: sorted(symbols) for mod_name, symbols
+                            in self._used_symbols_from_module.items()}}
+            _schedule_use_cache_save()
 
     # ------------------------------------------------------------------------
     def get_used_modules(self):
@@ -329,6 +643,8 @@ class ModuleInfo:
 
         '''
         if self._psyir is None:
+            if self._processor is None:
+                self._processor = Fparser2Reader()
             try:
                 self._psyir = \
                     self._processor.generate_psyir(self.get_parse_tree())
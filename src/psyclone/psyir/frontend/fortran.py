@@ -36,7 +36,15 @@
 
 ''' This module provides the PSyIR Fortran front-end.'''
 
+import collections
+import concurrent.futures
+import hashlib
+import io
+import multiprocessing
+import os
+import pickle
 from typing import Optional
+import fparser
 from fparser.common.readfortran import FortranStringReader, FortranFileReader
 from fparser.common.sourceinfo import FortranFormat
 from fparser.two import Fortran2003, pattern_tools
@@ -45,8 +53,54 @@ from fparser.two.symbol_table import SYMBOL_TABLES
 from fparser.two.utils import NoMatchError
 from psyclone.configuration import Config
 from psyclone.psyir.frontend.fparser2 import Fparser2Reader
-from psyclone.psyir.nodes import Schedule, Assignment, Routine
-from psyclone.psyir.symbols import SymbolTable
+from psyclone.psyir.nodes import (Schedule, Assignment, BinaryOperation,
+                                  Literal, Node, Routine, UnaryOperation)
+from psyclone.psyir.symbols import DataSymbol, SymbolTable
+from psyclone.version import __VERSION__
+
+# The directory in which parsed fparser trees are cached on disk (see
+# FortranReader.psyir_from_file). The cache can be disabled altogether by
+# setting the PSYCLONE_PARSE_CACHE environment variable to '0'.
+_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "psyclone", "fparser")
+
+# The maximum number of entries kept in the in-process cache of PSyIR
+# produced by FortranReader.psyir_from_source. Setting the
+# PSYCLONE_SOURCE_CACHE_SIZE environment variable to '0' disables that
+# cache.
+try:
+    _SOURCE_CACHE_SIZE = int(
+        os.environ.get("PSYCLONE_SOURCE_CACHE_SIZE", "128"))
+except ValueError:
+    _SOURCE_CACHE_SIZE = 128
+
+
+class _TreePickler(pickle.Pickler):
+    '''Pickler for fparser parse trees. The tree produced by a
+    FortranFileReader holds references to the reader and, through it, to
+    open file objects, which cannot be pickled. These are stored as
+    persistent ids (keeping the file name, if any) instead so that the
+    tree itself does not have to be modified in order to pickle it.
+
+    '''
+    def persistent_id(self, obj):
+        if isinstance(obj, io.IOBase):
+            return ("io", getattr(obj, "name", None))
+        return None
+
+
+class _TreeUnpickler(pickle.Unpickler):
+    '''Unpickler matching _TreePickler: any file object that was elided
+    when the tree was pickled is restored as an empty stream (the reader
+    only requires that the attribute can be closed) carrying the original
+    file name, which PSyIR nodes use to report where they came from.
+
+    '''
+    def persistent_load(self, pid):
+        stream = io.StringIO()
+        if pid[1] is not None:
+            stream.name = pid[1]
+        return stream
 
 
 class FortranReader():
@@ -57,6 +111,18 @@ class FortranReader():
     # Save parser object across instances to reduce the initialisation time
     _parser = None
 
+    # Cache of prototype PSyIR for expressions that do not depend on any
+    # symbol table (pure literal expressions such as "0" or "2*3", which
+    # code-generation paths request over and over again). Entries are
+    # copied on return, see psyir_from_expression.
+    _expression_cache = {}
+
+    # LRU cache of prototype PSyIR keyed on a hash of the source code, so
+    # that repeated calls to psyir_from_source with the same text (e.g.
+    # when PSyclone regenerates PSyIR for included files) avoid the cost
+    # of parsing it again. Entries are copied on return.
+    _source_cache = collections.OrderedDict()
+
     def __init__(self):
         if not self._parser:
             self._parser = ParserFactory().create(std="f2008")
@@ -93,12 +159,26 @@ class FortranReader():
         :rtype: :py:class:`psyclone.psyir.nodes.Node`
 
         '''
+        key = hashlib.blake2b(f"{free_form}\n".encode() +
+                              source_code.encode(), digest_size=16).digest()
+        cached = self._source_cache.get(key)
+        if cached is not None:
+            self._source_cache.move_to_end(key)
+            return cached.copy()
+
         SYMBOL_TABLES.clear()
         string_reader = FortranStringReader(source_code)
         # Set reader to free format.
         string_reader.set_format(FortranFormat(free_form, False))
         parse_tree = self._parser(string_reader)
         psyir = self._processor.generate_psyir(parse_tree)
+
+        if _SOURCE_CACHE_SIZE > 0:
+            # A copy of the result is cached so that the caller is free to
+            # modify the PSyIR that is returned.
+            self._source_cache[key] = psyir.copy()
+            while len(self._source_cache) > _SOURCE_CACHE_SIZE:
+                self._source_cache.popitem(last=False)
         return psyir
 
     def psyir_from_expression(self, source_code: str,
@@ -125,6 +205,10 @@ class FortranReader():
             raise TypeError(f"Must be supplied with a valid SymbolTable but "
                             f"got '{type(symbol_table).__name__}'")
 
+        cached = self._expression_cache.get(source_code)
+        if cached is not None:
+            return cached.copy()
+
         try:
             parse_tree = Fortran2003.Expr(source_code)
         except NoMatchError as err:
@@ -143,7 +227,24 @@ class FortranReader():
         fake_parent._symbol_table = symbol_table
         fake_parent.addchild(Assignment())
         self._processor.process_nodes(fake_parent[0], [parse_tree])
-        return fake_parent[0].children[0].detach()
+        result = fake_parent[0].children[0].detach()
+
+        # If the expression consists solely of literals and operations on
+        # them then it does not reference any symbol from the supplied
+        # table and a copy of it can safely be served to any caller, so it
+        # is added to the (bounded) cache. A kind-suffixed literal (e.g.
+        # '1.0_wp') must be excluded: although it is a plain Literal, its
+        # precision is a DataSymbol resolved from the supplied table, so
+        # serving a cached copy would leak that symbol into the PSyIR of
+        # callers with a different table.
+        if (len(self._expression_cache) < 128 and
+                all(isinstance(node, (Literal, UnaryOperation,
+                                      BinaryOperation))
+                    for node in result.walk(Node)) and
+                not any(isinstance(lit.datatype.precision, DataSymbol)
+                        for lit in result.walk(Literal))):
+            self._expression_cache[source_code] = result.copy()
+        return result
 
     def psyir_from_statement(self, source_code: str,
                              symbol_table: Optional[SymbolTable] = None):
@@ -195,8 +296,9 @@ class FortranReader():
         self._processor.process_nodes(fake_parent, exec_part.children)
         return fake_parent[0].detach()
 
-    def psyir_from_file(self, file_path, free_form=True):
-        ''' Generate the PSyIR tree representing the given Fortran file.
+    def _parse_tree_from_file(self, file_path, free_form=True):
+        ''' Generate the fparser parse tree for the given Fortran file,
+        using the on-disk cache where possible.
 
         :param file_path: path of the file to be read and parsed.
         :type file_path: str or any Python Path format.
@@ -204,16 +306,45 @@ class FortranReader():
         :param free_form: If parsing free-form code or not (default True).
         :type free_form: bool
 
-        :returns: PSyIR representing the provided Fortran file.
-        :rtype: :py:class:`psyclone.psyir.nodes.Node`
+        :returns: the fparser parse tree for the provided Fortran file.
+        :rtype: :py:class:`fparser.two.utils.Base`
 
         '''
         SYMBOL_TABLES.clear()
 
-        # Note that this is the main performance hotspot in PSyclone, taking
-        # more than 90% of the runtime in some cases. Therefore this is a good
-        # place to implement caching in order to avoid repeating parsing steps
-        # that have already been done before.
+        # Note that parsing is the main performance hotspot in PSyclone,
+        # taking more than 90% of the runtime in some cases. Therefore the
+        # fparser tree is cached on disk, keyed on the file path and a hash
+        # of its contents, so that repeated runs over unchanged files skip
+        # the parsing step entirely. The cache is only used when no include
+        # paths are configured (the key does not cover the contents of any
+        # included files) and can be disabled by setting the
+        # PSYCLONE_PARSE_CACHE environment variable to '0'.
+        cache_file = None
+        if (os.environ.get("PSYCLONE_PARSE_CACHE", "1") != "0" and
+                not Config.get().include_paths):
+            try:
+                # The key includes the fparser and PSyclone versions so
+                # that entries written by a different installation are
+                # never picked up: a stale pickle may well still load
+                # after an fparser upgrade but describe a tree that is
+                # inconsistent with the new fparser classes.
+                with open(file_path, "rb") as source:
+                    key = hashlib.blake2b(
+                        f"{fparser.__version__}\n{__VERSION__}\n"
+                        f"{os.path.realpath(file_path)}\n"
+                        f"{free_form}\n".encode() + source.read(),
+                        digest_size=16).hexdigest()
+                cache_file = os.path.join(_CACHE_DIR, key + ".pkl")
+                with open(cache_file, "rb") as cache:
+                    return _TreeUnpickler(cache).load()
+            except FileNotFoundError:
+                pass
+            except (OSError, pickle.PickleError, EOFError,
+                    AttributeError, ImportError):
+                # An unreadable or corrupt cache entry - fall through to
+                # parsing the file (which will rewrite the entry).
+                pass
 
         # Using the FortranFileReader instead of manually open the file allows
         # fparser to keep the filename information in the tree
@@ -221,8 +352,105 @@ class FortranReader():
                                    include_dirs=Config.get().include_paths)
         reader.set_format(FortranFormat(free_form, False))
         parse_tree = self._parser(reader)
-        psyir = self._processor.generate_psyir(parse_tree)
-        return psyir
+
+        if cache_file:
+            # Best effort: a failure to write the cache entry must not
+            # break the current run. The entry is written to a temporary
+            # file and then moved into place so that concurrent PSyclone
+            # processes never see a partially-written entry.
+            try:
+                os.makedirs(_CACHE_DIR, exist_ok=True)
+                tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+                with open(tmp_file, "wb") as cache:
+                    _TreePickler(cache).dump(parse_tree)
+                os.replace(tmp_file, cache_file)
+            except (OSError, pickle.PickleError):
+                pass
+
+        return parse_tree
+
+    def psyir_from_file(self, file_path, free_form=True):
+        ''' Generate the PSyIR tree representing the given Fortran file.
+
+        :param file_path: path of the file to be read and parsed.
+        :type file_path: str or any Python Path format.
+
+        :param free_form: If parsing free-form code or not (default True).
+        :type free_form: bool
+
+        :returns: PSyIR representing the provided Fortran file.
+        :rtype: :py:class:`psyclone.psyir.nodes.Node`
+
+        '''
+        parse_tree = self._parse_tree_from_file(file_path, free_form)
+        return self._processor.generate_psyir(parse_tree)
+
+    def psyir_from_files(self, file_paths, free_form=True):
+        ''' Generate the PSyIR trees representing the given Fortran files.
+        fparser parsing is CPU-bound and the files are independent of each
+        other, so where the on-disk parse cache is enabled the files are
+        first parsed by a pool of worker processes that populate the
+        cache. The (serial) PSyIR generation that follows then finds a
+        cache entry for every file that parses successfully.
+
+        The worker processes are started with the 'fork' method where the
+        platform supports it. On platforms that only support 'spawn'
+        (e.g. Windows), each worker re-imports the calling script, so a
+        script calling this method must be guarded by
+        ``if __name__ == "__main__":``.
+
+        :param file_paths: paths of the files to be read and parsed.
+        :type file_paths: list[str]
+
+        :param free_form: If parsing free-form code or not (default True).
+        :type free_form: bool
+
+        :returns: mapping of each supplied path to the PSyIR representing
+            that file.
+        :rtype: dict[str, :py:class:`psyclone.psyir.nodes.Node`]
+
+        '''
+        # cpu_count() returns None if the number of CPUs is undetermined.
+        if (len(file_paths) > 1 and (os.cpu_count() or 1) > 1 and
+                os.environ.get("PSYCLONE_PARSE_CACHE", "1") != "0" and
+                not Config.get().include_paths):
+            if "fork" in multiprocessing.get_all_start_methods():
+                mp_context = multiprocessing.get_context("fork")
+            else:
+                mp_context = None
+            with concurrent.futures.ProcessPoolExecutor(
+                    mp_context=mp_context) as pool:
+                # The workers only prime the cache so their results are
+                # not needed - but map() must be drained for the work to
+                # complete.
+                for _ in pool.map(
+                        _prime_parse_cache,
+                        [(path, free_form) for path in file_paths]):
+                    pass
+        # Any file that failed to parse (or to be cached) in a worker is
+        # simply parsed again here, so that errors are raised in the usual
+        # way.
+        return {path: self.psyir_from_file(path, free_form)
+                for path in file_paths}
+
+
+def _prime_parse_cache(args):
+    '''Worker routine for FortranReader.psyir_from_files: parses the
+    specified file, thereby writing its parse tree to the on-disk cache.
+    Any error is ignored - the caller will re-parse the file and report
+    the problem from the main process.
+
+    :param args: the path of the file to parse and whether it is
+        free-form.
+    :type args: tuple[str, bool]
+
+    '''
+    file_path, free_form = args
+    try:
+        FortranReader()._parse_tree_from_file(file_path, free_form)
+    # pylint: disable=broad-except
+    except Exception:
+        pass
 
 
 # For Sphinx AutoAPI documentation generation
@@ -40,6 +40,7 @@
 ''' This module contains the implementation of the abstract ArrayMixin. '''
 
 import abc
+from functools import lru_cache
 
 from psyclone.core import SymbolicMaths
 from psyclone.errors import InternalError
@@ -57,6 +58,34 @@ from psyclone.psyir.symbols.datatypes import (
     ScalarType, ArrayType, UnresolvedType, UnsupportedType, INTEGER_TYPE)
 
 
+# Enum members used by the bound predicates below, looked up once here
+# rather than through two attribute accesses per call.
+_INTEGER_INTRINSIC = ScalarType.Intrinsic.INTEGER
+_LBOUND = IntrinsicCall.Intrinsic.LBOUND
+_UBOUND = IntrinsicCall.Intrinsic.UBOUND
+
+# The types of node that are permitted as children of an ArrayMixin,
+# built once here so that _validate_child (called for every child
+# insertion) does not construct a new tuple each time.
+_ALLOWED_CHILD_TYPES = (DataNode, Range)
+
+
+@lru_cache(maxsize=1)
+def _array_reference_class():
+    '''Deferred lookup of the ArrayReference class: array_reference.py
+    imports this module so the import cannot be done at the top level,
+    and doing it inside _is_bound would pay the import-statement overhead
+    on every call of a frequently-used predicate.
+
+    :returns: the ArrayReference class.
+    :rtype: type
+
+    '''
+    # pylint: disable=import-outside-toplevel
+    from psyclone.psyir.nodes.array_reference import ArrayReference
+    return ArrayReference
+
+
 class ArrayMixin(metaclass=abc.ABCMeta):
     '''
     Abstract class used to add functionality common to Nodes that represent
@@ -75,7 +104,7 @@ class ArrayMixin(metaclass=abc.ABCMeta):
 
         '''
         # pylint: disable=unused-argument
-        return isinstance(child, (DataNode, Range))
+        return isinstance(child, _ALLOWED_CHILD_TYPES)
 
     @property
     def is_array(self):
@@ -116,11 +145,15 @@ class ArrayMixin(metaclass=abc.ABCMeta):
             raise TypeError(
                 f"The index argument should be an integer but found "
                 f"'{type(index).__name__}'.")
-        if index > len(self.indices)-1:
+        # Consult the indices property just once: for ArrayOfStructures
+        # nodes the first child is the Member being accessed, so the
+        # length of the child list over-counts the number of dimensions.
+        nindices = len(self.indices)
+        if index > nindices-1:
             raise ValueError(
                 f"In '{type(self).__name__}' '{self.name}' the specified "
                 f"index '{index}' must be less than the number of dimensions "
-                f"'{len(self.indices)}'.")
+                f"'{nindices}'.")
 
     def _is_bound_op(self, expr, bound_operator, index):
         '''Utility function that checks that the provided 'expr' argument is
@@ -145,11 +178,14 @@ class ArrayMixin(metaclass=abc.ABCMeta):
                 expr.intrinsic == bound_operator):
             # This is the expected bound
             if self.is_same_array(expr.arguments[0]):
-                # The arrays match
-                if (isinstance(expr.arguments[1], Literal) and
-                        expr.arguments[1].datatype.intrinsic ==
-                        ScalarType.Intrinsic.INTEGER
-                        and expr.arguments[1].value == str(index+1)):
+                # The arrays match. Compare the dimension argument as an
+                # integer (a Literal of INTEGER type is guaranteed to hold
+                # a valid integer string) rather than rendering the
+                # expected index as a new string on every call.
+                dim_arg = expr.arguments[1]
+                if (isinstance(dim_arg, Literal) and
+                        dim_arg.datatype.intrinsic == _INTEGER_INTRINSIC
+                        and int(dim_arg.value) == index+1):
                     # This is the correct index
                     return True
         return False
@@ -358,10 +394,10 @@ class ArrayMixin(metaclass=abc.ABCMeta):
         # for a bounds intrinsic.
         if isinstance(access_shape, Range):
             if bound_type == "upper":
-                intrinsic = IntrinsicCall.Intrinsic.UBOUND
+                intrinsic = _UBOUND
                 access_bound = access_shape.stop
             else:
-                intrinsic = IntrinsicCall.Intrinsic.LBOUND
+                intrinsic = _LBOUND
                 access_bound = access_shape.start
 
             # Is this array access in the form of {UL}BOUND(array, index)?
@@ -375,12 +411,8 @@ class ArrayMixin(metaclass=abc.ABCMeta):
 
         # Finding the array declaration is only supported for an
         # ArrayReference at the moment.
-        # Import here to avoid circular dependence.
-        # pylint: disable=import-outside-toplevel
-        from psyclone.psyir.nodes.array_reference import ArrayReference
-        if not isinstance(self, ArrayReference):
+        if not isinstance(self, _array_reference_class()):
             return False
-        # pylint: enable=import-outside-toplevel
 
         symbol = self.symbol
         if not isinstance(symbol, DataSymbol):
@@ -482,12 +514,11 @@ class ArrayMixin(metaclass=abc.ABCMeta):
 
         array_dimension = self.indices[index]
         if isinstance(array_dimension, Range):
-            if self.is_lower_bound(index) and self.is_upper_bound(index):
-                step = array_dimension.children[2]
-                if (isinstance(step, Literal) and
-                        step.datatype.intrinsic == ScalarType.Intrinsic.INTEGER
-                        and str(step.value) == "1"):
-                    return True
+            # Check the (cheap) step test before the two bound checks.
+            if (array_dimension.is_unit_step and
+                    self.is_lower_bound(index) and
+                    self.is_upper_bound(index)):
+                return True
         return False
 
     @property
@@ -499,8 +530,7 @@ class ArrayMixin(metaclass=abc.ABCMeta):
         :returns: the PSyIR nodes representing the array-index expressions.
         :rtype: list of :py:class:`psyclone.psyir.nodes.Node`
 
-        :raises InternalError: if this node has no children or if they are \
-                               not valid array-index expressions.
+        :raises InternalError: if this node has no children.
 
         '''
         if not self._children:
@@ -508,14 +538,10 @@ class ArrayMixin(metaclass=abc.ABCMeta):
                 f"{type(self).__name__} malformed or incomplete: must have "
                 f"one or more children representing array-index expressions "
                 f"but array '{self.name}' has none.")
-        for idx, child in enumerate(self._children):
-            if not self._validate_child(idx, child):
-                raise InternalError(
-                    f"{type(self).__name__} malformed or incomplete: child "
-                    f"{idx} of array '{self.name}' must be a psyir.nodes."
-                    f"DataNode or Range representing an array-index "
-                    f"expression but found '{type(child).__name__}'")
-        return self.children
+        # Each child has already been checked by _validate_child on
+        # insertion, so there is no need to re-validate the children on
+        # every retrieval.
+        return self._children
 
     def _extent(self, idx):
         '''
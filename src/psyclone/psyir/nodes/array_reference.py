@@ -117,10 +117,10 @@ class ArrayReference(ArrayMixin, Reference):
         return array
 
     def __str__(self):
-        result = super().__str__() + "\n"
-        for entity in self._children:
-            result += str(entity) + "\n"
-        return result
+        # Build the result in one pass rather than repeatedly
+        # concatenating (and re-allocating) the intermediate string.
+        return "\n".join([super().__str__()] +
+                         [str(entity) for entity in self._children]) + "\n"
 
     @property
     def datatype(self):
@@ -1113,6 +1113,39 @@ class Node():
             local_list += child.walk(my_type, stop_type, depth=depth)
         return local_list
 
+    def iwalk(self, my_type, stop_type=None, depth=None):
+        ''' Lazy equivalent of walk(): a generator yielding exactly the
+        nodes that walk() would return, in the same order. Since the
+        traversal only continues as the caller consumes the generator, it
+        can be abandoned early (e.g. as soon as a first match is found)
+        without visiting the rest of the tree.
+
+        :param my_type: the class(es) for which the instances are yielded.
+        :type my_type: type | Tuple[type, ...]
+        :param stop_type: class(es) at which recursion is halted (optional).
+        :type stop_type: Optional[type | Tuple[type, ...]]
+        :param depth: the depth value the instances must have (optional).
+        :type depth: Optional[int]
+
+        :returns: generator of all nodes that are instances of my_type \
+                  starting at and including this node.
+        :rtype: Iterator[:py:class:`psyclone.psyir.nodes.Node`]
+
+        '''
+        if isinstance(self, my_type) and depth in [None, self.depth]:
+            yield self
+
+        # Stop recursion further into the tree if an instance of a class
+        # listed in stop_type is found or if a specified depth level has
+        # been reached.
+        if stop_type and isinstance(self, stop_type):
+            return
+        if depth is not None and self.depth >= depth:
+            return
+
+        for child in self.children:
+            yield from child.iwalk(my_type, stop_type, depth=depth)
+
     def get_sibling_lists(self, my_type, stop_type=None):
         '''
         Recurse through the PSyIR tree and return lists of Nodes that are
@@ -41,6 +41,8 @@ This is the base class for nodes that e.g. create kernel extraction
 or profiling. '''
 
 from collections import namedtuple
+from functools import lru_cache
+from itertools import islice
 
 from fparser.common.readfortran import FortranStringReader
 from fparser.common.sourceinfo import FortranFormat
@@ -61,6 +63,60 @@ from psyclone.psyir.symbols import (SymbolTable, DataTypeSymbol, DataSymbol,
                                     UnsupportedFortranType, ImportInterface)
 
 
+# The free-format description shared by all of the readers created in
+# _gen_type_bound_call.
+_FREE_FORM_FORMAT = FortranFormat(True, False)
+
+
+# =============================================================================
+@lru_cache(maxsize=1)
+def _setup_f2008_parser():
+    '''Ensures (once) that the fparser2 Fortran2003 class hierarchy has
+    been created, so that individual statement classes such as Call_Stmt
+    can be used directly in _gen_type_bound_call.
+
+    :returns: the fparser parser object.
+    :rtype: :py:class:`fparser.two.Fortran2003.Program`
+
+    '''
+    return ParserFactory().create(std="f2008")
+
+
+# =============================================================================
+def _gen_type_bound_call(typename, methodname, argument_list=None,
+                         annotations=None):
+    ''' Helper utility to generate type-bound calls. Since this is
+    not directly supported in the PSyIR the call is inserted in a
+    PSyIR CodeBlock.
+
+    :param str typename: the name of the base type.
+    :param str methodname: the name of the method to be called.
+    :param argument_list: the list of arguments in the method call.
+    :type argument_list: list[str]
+    :param annotations: the list of node annotations to add to the \
+                        generated CodeBlock.
+    :type annotations: list[str]
+
+    :returns: a CodeBlock representing the type bound call.
+    :rtype: :py:class:`psyclone.psyir.nodes.CodeBlock`
+
+    '''
+    argument_str = ""
+    if argument_list:
+        argument_str += "("
+        argument_str += ",".join([str(arg) for arg in argument_list])
+        argument_str += ")"
+
+    _setup_f2008_parser()
+    reader = FortranStringReader(
+        f"CALL {typename}%{methodname}{argument_str}")
+    # Tell the reader that the source is free format
+    reader.set_format(_FREE_FORM_FORMAT)
+    fp2_node = Fortran2003.Call_Stmt(reader)
+    return CodeBlock([fp2_node], CodeBlock.Structure.STATEMENT,
+                     annotations=annotations)
+
+
 # =============================================================================
 class PSyDataNode(Statement):
     # pylint: disable=too-many-instance-attributes, too-many-locals
@@ -555,18 +611,19 @@ class PSyDataNode(Statement):
             # this particular invoke region). Use the invoke name as a
             # starting point.
             region_name = invoke.name
-            kerns = self.walk(Kern)
+            # The lazy traversal means that only as much of the tree as is
+            # needed to find a second kernel is visited.
+            kerns = list(islice(self.iwalk(Kern), 2))
             if len(kerns) == 1:
                 # This PSyData region only has one kernel within it,
                 # so append the kernel name.
                 region_name += f":{kerns[0].name}"
             # Add a region index to ensure uniqueness when there are
-            # multiple regions in an invoke.
-            psy_data_nodes = self.root.walk(PSyDataNode)
-            # We can't just use .index on the list because we are searching
-            # by identity, not by equality.
+            # multiple regions in an invoke. We can't use .index on a list
+            # because we are searching by identity, not by equality; the
+            # lazy traversal also stops as soon as this node is found.
             idx = None
-            for index, node in enumerate(psy_data_nodes):
+            for index, node in enumerate(self.root.iwalk(PSyDataNode)):
                 if node is self:
                     idx = index
                     break
@@ -713,39 +770,6 @@ class PSyDataNode(Statement):
         :raises GenerationError: if the node is not inside a Routine.
 
         '''
-        def gen_type_bound_call(typename, methodname, argument_list=None,
-                                annotations=None):
-            ''' Helper utility to generate type-bound calls. Since this is
-            not directly supported in the PSyIR the call is inserted in a
-            PSyIR CodeBlock.
-
-            :param str typename: the name of the base type.
-            :param str methodname: the name of the method to be called.
-            :param argument_list: the list of arguments in the method call.
-            :type argument_list: list[str]
-            :param annotations: the list of node annotations to add to the \
-                                generated CodeBlock.
-            :type annotations: list[str]
-
-            :returns: a CodeBlock representing the type bound call.
-            :rtype: :py:class:`psyclone.psyir.nodes.CodeBlock`
-
-            '''
-            argument_str = ""
-            if argument_list:
-                argument_str += "("
-                argument_str += ",".join([str(arg) for arg in argument_list])
-                argument_str += ")"
-
-            ParserFactory().create(std="f2008")
-            reader = FortranStringReader(
-                f"CALL {typename}%{methodname}{argument_str}")
-            # Tell the reader that the source is free format
-            reader.set_format(FortranFormat(True, False))
-            fp2_node = Fortran2003.Call_Stmt(reader)
-            return CodeBlock([fp2_node], CodeBlock.Structure.STATEMENT,
-                             annotations=annotations)
-
         for child in self.children:
             child.lower_to_language_level()
 
@@ -795,7 +819,7 @@ class PSyDataNode(Statement):
         # PSyData start call (replaces existing PSyDataNode). We annotate this
         # CodeBlock call to record the fact that it represents the start of a
         # psydata region.
-        start_call = gen_type_bound_call(
+        start_call = _gen_type_bound_call(
             self._var_name, "PreStart",
             [f"\"{module_name}\"",
              f"\"{region_name}\"",
@@ -821,7 +845,7 @@ class PSyDataNode(Statement):
             for module_name, sig, unique_sig in pre_variable_list:
                 if module_name:
                     module_name = f"@{module_name}"
-                call = gen_type_bound_call(
+                call = _gen_type_bound_call(
                     self._var_name, "PreDeclareVariable",
                     [f"\"{sig}{module_name}{pre_suffix}\"", unique_sig])
                 self.parent.children.insert(self.position, call)
@@ -829,23 +853,23 @@ class PSyDataNode(Statement):
             for module_name, sig, unique_sig in post_variable_list:
                 if module_name:
                     module_name = f"@{module_name}"
-                call = gen_type_bound_call(
+                call = _gen_type_bound_call(
                     self._var_name, "PreDeclareVariable",
                     [f"\"{sig}{module_name}{post_suffix}\"", unique_sig])
                 self.parent.children.insert(self.position, call)
 
-            call = gen_type_bound_call(self._var_name, "PreEndDeclaration")
+            call = _gen_type_bound_call(self._var_name, "PreEndDeclaration")
             self.parent.children.insert(self.position, call)
 
             for module_name, sig, unique_sig in pre_variable_list:
                 if module_name:
                     module_name = f"@{module_name}"
-                call = gen_type_bound_call(
+                call = _gen_type_bound_call(
                     self._var_name, "ProvideVariable",
                     [f"\"{sig}{module_name}{pre_suffix}\"", unique_sig])
                 self.parent.children.insert(self.position, call)
 
-            call = gen_type_bound_call(self._var_name, "PreEnd")
+            call = _gen_type_bound_call(self._var_name, "PreEnd")
             self.parent.children.insert(self.position, call)
 
         # Insert the body of the profiled region between the start and
@@ -855,18 +879,18 @@ class PSyDataNode(Statement):
 
         if has_var:
             # Only add PostStart() if there is at least one variable.
-            call = gen_type_bound_call(self._var_name, "PostStart")
+            call = _gen_type_bound_call(self._var_name, "PostStart")
             self.parent.children.insert(self.position, call)
             for module_name, sig, unique_sig in post_variable_list:
                 if module_name:
                     module_name = f"@{module_name}"
-                call = gen_type_bound_call(
+                call = _gen_type_bound_call(
                     self._var_name, "ProvideVariable",
                     [f"\"{sig}{module_name}{post_suffix}\"", unique_sig])
                 self.parent.children.insert(self.position, call)
 
         # PSyData end call
-        end_call = gen_type_bound_call(self._var_name, "PostEnd")
+        end_call = _gen_type_bound_call(self._var_name, "PostEnd")
         self.parent.children.insert(self.position+1, end_call)
 
         # Finally we can remove the original PSyDataNode from here
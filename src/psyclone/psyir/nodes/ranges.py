@@ -258,5 +258,17 @@ class Range(Node):
         else:
             self.children[2] = value
 
+    @property
+    def is_unit_step(self):
+        '''
+        :returns: whether the step of this Range is known to be the \
+            integer literal 1.
+        :rtype: bool
+        '''
+        step = self.step
+        return (isinstance(step, Literal) and
+                step.datatype.intrinsic == ScalarType.Intrinsic.INTEGER and
+                step.value == "1")
+
     def __str__(self):
         return self.node_str(colour=False)
@@ -48,7 +48,11 @@ from psyclone.psyir.symbols.symbol import Symbol
 
 
 class DataType(metaclass=abc.ABCMeta):
-    '''Abstract base class from which all types are derived.'''
+    '''Abstract base class from which all types are derived. A source tree
+    holds a type instance for every symbol, so all classes in this
+    hierarchy use __slots__ to keep the per-instance footprint down.'''
+
+    __slots__ = ()
 
     @abc.abstractmethod
     def __str__(self):
@@ -72,6 +76,8 @@ class UnresolvedType(DataType):
     # pylint: disable=too-few-public-methods
     ''' Indicates that the type declaration has not been found yet. '''
 
+    __slots__ = ()
+
     def __str__(self):
         return "UnresolvedType"
 
@@ -81,6 +87,8 @@ class NoType(DataType):
     ''' Indicates that the associated symbol has an empty type (equivalent
     to `void` in C). '''
 
+    __slots__ = ()
+
     def __str__(self):
         return "NoType"
 
@@ -97,6 +105,8 @@ class UnsupportedType(DataType, metaclass=abc.ABCMeta):
     :raises TypeError: if the supplied declaration_txt is not a str.
 
     '''
+    __slots__ = ("_declaration",)
+
     def __init__(self, declaration_txt):
         if not isinstance(declaration_txt, str):
             raise TypeError(
@@ -135,6 +145,8 @@ class UnsupportedFortranType(UnsupportedType):
         :py:class:`psyclone.psyir.symbols.DataTypeSymbol`]
 
     '''
+    __slots__ = ("_type_text", "_partial_datatype")
+
     def __init__(self, declaration_txt, partial_datatype=None):
         super().__init__(declaration_txt)
         # This will hold the Fortran type specification (as opposed to
@@ -248,6 +260,7 @@ class ScalarType(DataType):
     :raises ValueError: if any of the argument have unexpected values.
 
     '''
+    __slots__ = ("_intrinsic", "_precision")
 
     class Intrinsic(Enum):
         '''Enumeration of the different intrinsic scalar datatypes that are
@@ -366,6 +379,8 @@ class ArrayType(DataType):
     :raises NotImplementedError: if a structure type does not have a \
                                  DataTypeSymbol as its type.
     '''
+    __slots__ = ("_intrinsic", "_precision", "_shape", "_datatype")
+
     class Extent(Enum):
         '''
         Enumeration of array shape extents that are unspecified at compile
@@ -720,6 +735,8 @@ class StructureType(DataType):
     SymbolTable functionality then this decision could be revisited.
 
     '''
+    __slots__ = ("_components",)
+
     # Each member of a StructureType is represented by a ComponentType
     # (named tuple).
     ComponentType = namedtuple("ComponentType", [
@@ -47,7 +47,9 @@ from fparser.two.parser import ParserFactory
 from fparser.two.symbol_table import SYMBOL_TABLES
 from psyclone.configuration import Config
 from psyclone.parse import ModuleManager
+from psyclone.parse import module_info
 from psyclone.psyir.backend.fortran import FortranWriter
+from psyclone.psyir.frontend import fortran
 from psyclone.psyir.frontend.fortran import FortranReader
 from psyclone.tests.gocean_build import GOceanBuild
 from psyclone.tests.lfric_build import LFRicBuild
@@ -89,6 +91,20 @@ def have_graphviz():
     return True
 
 
+@pytest.fixture(scope="session", autouse=True)
+def redirect_on_disk_caches(tmpdir_factory):
+    '''This per-session fixture redirects the on-disk caches (the fparser
+    parse-tree cache of the Fortran frontend and the use-statement cache
+    of ModuleInfo) into a session-scoped temporary directory, so that
+    running the test suite neither reads from nor writes to the real
+    cache in the user's home directory. Tests of the caches themselves
+    monkeypatch these locations again with per-test directories.
+    '''
+    cache_dir = tmpdir_factory.mktemp("psyclone_cache")
+    fortran._CACHE_DIR = str(cache_dir.join("fparser"))
+    module_info._USE_CACHE_FILE = str(cache_dir.join("use_stmts.json"))
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_psyclone_config():
     '''This per session fixture defines the environment variable
@@ -678,7 +678,11 @@ def test_fieldarg_stencil():
     with pytest.raises(ValueError) as info:
         field_arg.stencil = ["000", "011", "00"]
     assert ("Stencil entries should follow the regular expression "
-            "[01]{3,3}, but found '00'." in str(info.value))
+            "[01]{3}, but found '00'." in str(info.value))
+    with pytest.raises(ValueError) as info:
+        field_arg.stencil = ["000", "011", "0000"]
+    assert ("Stencil entries should follow the regular expression "
+            "[01]{3}, but found '0000'." in str(info.value))
 
     field_arg = kernel_metadata.meta_args[0]
     assert field_arg.form == "GO_POINTWISE"
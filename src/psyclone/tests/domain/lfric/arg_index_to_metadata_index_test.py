@@ -37,15 +37,128 @@
 class.
 
 '''
+import pytest
+
 from psyclone.domain.lfric import ArgIndexToMetadataIndex
 from psyclone.domain.lfric.kernel import (
     ScalarArgMetadata, FieldArgMetadata, FieldVectorArgMetadata,
     OperatorArgMetadata, ColumnwiseOperatorArgMetadata, LFRicKernelMetadata)
 
 
+@pytest.fixture(autouse=True)
+def reset_class_state(monkeypatch):
+    '''ArgIndexToMetadataIndex keeps its working state (_index, _info and
+    _metadata) in class variables. Reset them via monkeypatch for every
+    test so that state left behind by one test cannot bleed into
+    another.
+
+    '''
+    monkeypatch.setattr(ArgIndexToMetadataIndex, "_index", 0, raising=False)
+    monkeypatch.setattr(ArgIndexToMetadataIndex, "_info", {}, raising=False)
+    monkeypatch.setattr(
+        ArgIndexToMetadataIndex, "_metadata", None, raising=False)
+
+
+def _create_metadata(meta_args):
+    '''Utility to create and validate kernel metadata from the supplied
+    meta_args. The fixtures below call this once per module so that the
+    (relatively expensive) validation is not repeated for every test.
+
+    :param meta_args: the meta_args metadata.
+    :type meta_args: List[subclass of \
+        :py:class:`psyclone.domain.lfric.kernel.CommonArgMetadata`]
+
+    :returns: validated kernel metadata.
+    :rtype: :py:class:`psyclone.domain.lfric.kernel.LFRicKernelMetadata`
+
+    '''
+    metadata = LFRicKernelMetadata(
+        operates_on="cell_column", meta_args=meta_args)
+    metadata.validate()
+    return metadata
+
+
+@pytest.fixture(name="scalar_args", scope="module")
+def scalar_args_fixture():
+    '''
+    :returns: a scalar meta_arg and validated metadata containing it. \
+        Note, at least one field/operator is needed for the metadata to \
+        be valid.
+    :rtype: Tuple[\
+        :py:class:`psyclone.domain.lfric.kernel.ScalarArgMetadata`, \
+        :py:class:`psyclone.domain.lfric.kernel.LFRicKernelMetadata`]
+
+    '''
+    meta_arg = ScalarArgMetadata("GH_REAL", "GH_READ")
+    metadata = _create_metadata(
+        [FieldArgMetadata("GH_REAL", "GH_INC", "W0"), meta_arg])
+    return meta_arg, metadata
+
+
+@pytest.fixture(name="field_args", scope="module")
+def field_args_fixture():
+    '''
+    :returns: a field meta_arg and validated metadata containing it.
+    :rtype: Tuple[\
+        :py:class:`psyclone.domain.lfric.kernel.FieldArgMetadata`, \
+        :py:class:`psyclone.domain.lfric.kernel.LFRicKernelMetadata`]
+
+    '''
+    meta_arg = FieldArgMetadata("GH_REAL", "GH_INC", "W0")
+    metadata = _create_metadata([meta_arg])
+    return meta_arg, metadata
+
+
+@pytest.fixture(name="field_vector_args", scope="module")
+def field_vector_args_fixture():
+    '''
+    :returns: a field-vector meta_arg and validated metadata containing \
+        it.
+    :rtype: Tuple[\
+        :py:class:`psyclone.domain.lfric.kernel.FieldVectorArgMetadata`, \
+        :py:class:`psyclone.domain.lfric.kernel.LFRicKernelMetadata`]
+
+    '''
+    meta_arg = FieldVectorArgMetadata("GH_REAL", "GH_INC", "W0", "3")
+    metadata = _create_metadata([meta_arg])
+    return meta_arg, metadata
+
+
+@pytest.fixture(name="operator_args", scope="module")
+def operator_args_fixture():
+    '''
+    :returns: an operator meta_arg and validated metadata containing it.
+    :rtype: Tuple[\
+        :py:class:`psyclone.domain.lfric.kernel.OperatorArgMetadata`, \
+        :py:class:`psyclone.domain.lfric.kernel.LFRicKernelMetadata`]
+
+    '''
+    meta_arg = OperatorArgMetadata("GH_REAL", "GH_WRITE", "W0", "W1")
+    metadata = _create_metadata([meta_arg])
+    return meta_arg, metadata
+
+
+@pytest.fixture(name="cma_operator_args", scope="module")
+def cma_operator_args_fixture():
+    '''
+    :returns: a columnwise-operator meta_arg and validated metadata \
+        containing it.
+    :rtype: Tuple[:py:class:`psyclone.domain.lfric.kernel.\
+        ColumnwiseOperatorArgMetadata`, \
+        :py:class:`psyclone.domain.lfric.kernel.LFRicKernelMetadata`]
+
+    '''
+    meta_arg = ColumnwiseOperatorArgMetadata("GH_REAL", "GH_WRITE",
+                                             "W0", "W1")
+    metadata = _create_metadata([meta_arg])
+    return meta_arg, metadata
+
+
 def call_method(method_name, meta_arg, metadata):
     '''Utility method to initialise the required class variables and then
-    call the method specified in the method_name argument.
+    call the method specified in the method_name argument. The supplied
+    metadata is expected to have already been validated (see the
+    fixtures above).
 
     :param str method_name: the name of the method to call.
     :param meta_arg: the meta_arg metadata to pass to the call.
@@ -59,7 +172,6 @@ def call_method(method_name, meta_arg, metadata):
     :rtype: :py:class:`psyclone.domain.lfric.ArgIndexToMetadataIndex`
 
     '''
-    metadata.validate()
     cls = ArgIndexToMetadataIndex
     cls._initialise(None)
     cls._metadata = metadata
@@ -78,71 +190,43 @@ def test_initialise():
     assert not cls._info
 
 
-def test_scalar():
-    '''Test the _scalar method. Note, we need at least one field/operator
-    for the metadata to be valid.
-
-    '''
-    meta_arg = ScalarArgMetadata("GH_REAL", "GH_READ")
-    meta_args = [
-        FieldArgMetadata("GH_REAL", "GH_INC", "W0"),
-        meta_arg]
-    metadata = LFRicKernelMetadata(
-        operates_on="cell_column", meta_args=meta_args)
+def test_scalar(scalar_args):
+    '''Test the _scalar method.'''
+    meta_arg, metadata = scalar_args
     cls = call_method("_scalar", meta_arg, metadata)
-    assert len(cls._info) == 1
-    # pylint: disable=unsubscriptable-object
-    assert cls._info[0] == 1
+    assert cls._info == {0: 1}
     assert cls._index == 1
 
 
-def test_field():
+def test_field(field_args):
     '''Test the _field method.'''
-    meta_arg = FieldArgMetadata("GH_REAL", "GH_INC", "W0")
-    metadata = LFRicKernelMetadata(
-        operates_on="cell_column", meta_args=[meta_arg])
+    meta_arg, metadata = field_args
     cls = call_method("_field", meta_arg, metadata)
-    assert len(cls._info) == 1
-    # pylint: disable=unsubscriptable-object
-    assert cls._info[0] == 0
+    assert cls._info == {0: 0}
     assert cls._index == 1
 
 
-def test_field_vector():
+def test_field_vector(field_vector_args):
     '''Test the _field_vector method.'''
-    meta_arg = FieldVectorArgMetadata("GH_REAL", "GH_INC", "W0", "3")
-    metadata = LFRicKernelMetadata(
-        operates_on="cell_column", meta_args=[meta_arg])
+    meta_arg, metadata = field_vector_args
     cls = call_method("_field_vector", meta_arg, metadata)
-    assert len(cls._info) == 3
-    # pylint: disable=unsubscriptable-object
-    assert cls._info[0] == 0
-    assert cls._info[1] == 0
-    assert cls._info[2] == 0
+    assert cls._info == {0: 0, 1: 0, 2: 0}
     assert cls._index == 3
 
 
-def test_operator():
+def test_operator(operator_args):
     '''Test the _operator method.'''
-    meta_arg = OperatorArgMetadata("GH_REAL", "GH_WRITE", "W0", "W1")
-    metadata = LFRicKernelMetadata(
-        operates_on="cell_column", meta_args=[meta_arg])
+    meta_arg, metadata = operator_args
     cls = call_method("_operator", meta_arg, metadata)
-    assert len(cls._info) == 1
-    # pylint: disable=unsubscriptable-object
-    assert cls._info[1] == 0
+    assert cls._info == {1: 0}
     assert cls._index == 2
 
 
-def test_cma_operator():
+def test_cma_operator(cma_operator_args):
     '''Test the _cma_operator method.'''
-    meta_arg = ColumnwiseOperatorArgMetadata("GH_REAL", "GH_WRITE", "W0", "W1")
-    metadata = LFRicKernelMetadata(
-        operates_on="cell_column", meta_args=[meta_arg])
+    meta_arg, metadata = cma_operator_args
     cls = call_method("_cma_operator", meta_arg, metadata)
-    assert len(cls._info) == 1
-    # pylint: disable=unsubscriptable-object
-    assert cls._info[0] == 0
+    assert cls._info == {0: 0}
     assert cls._index == 8
 
 
@@ -157,42 +241,35 @@ def test_add_arg():
     cls._metadata = metadata
     # call add_arg
     cls._add_arg(field_meta_arg)
-    assert len(cls._info) == 1
-    # pylint: disable=unsubscriptable-object
-    assert cls._info[0] == 0
+    assert cls._info == {0: 0}
     assert cls._index == 1
     # call add_arg again
     cls._add_arg(scalar_meta_arg)
-    assert len(cls._info) == 2
-    assert cls._info[0] == 0
-    assert cls._info[1] == 1
+    assert cls._info == {0: 0, 1: 1}
     assert cls._index == 2
 
 
-def test_remaining_methods():
+@pytest.mark.parametrize("method_name, delta, takes_arg", [
+    ("_cell_position", 1, False),
+    ("_mesh_height", 1, False),
+    ("_mesh_ncell2d_no_halos", 1, False),
+    ("_mesh_ncell2d", 1, False),
+    ("_cell_map", 4, False),
+    ("_stencil_cross2d_extent", 1, True),
+    ("_stencil_cross2d2d_max_extent", 1, True),
+    ("_stencil_extent", 1, True),
+    ("_stencil_xory1d_direction", 1, True),
+    ("_stencil_cross2d", 1, True),
+    ("_stencil", 1, True)])
+def test_remaining_methods(method_name, delta, takes_arg):
     '''Test the remaining methods. Each of these increments the _index
     variable by one, apart from _cell_map which increments it by four.
 
     '''
     cls = ArgIndexToMetadataIndex
     cls._initialise(None)
-    # Check the methods that increase _index by 1 and have no arguments.
-    count = 0
-    for method_name in (
-            ["_cell_position", "_mesh_height", "_mesh_ncell2d_no_halos",
-             "_mesh_ncell2d"]):
-        getattr(cls, method_name)()
-        count += 1
-        assert cls._index == count
-    # Check the one method that increases _index by 4 and has no arguments.
-    cls._cell_map()
-    count += 4
-    assert cls._index == count
-    # Check the methods that increase _index by 1 and have an argument.
-    for method_name in (
-            ["_stencil_cross2d_extent", "_stencil_cross2d2d_max_extent",
-             "_stencil_extent", "_stencil_xory1d_direction",
-             "_stencil_cross2d", "_stencil"]):
+    if takes_arg:
         getattr(cls, method_name)(None)
-        count += 1
-        assert cls._index == count
+    else:
+        getattr(cls, method_name)()
+    assert cls._index == delta
@@ -40,9 +40,28 @@ import pytest
 
 from fparser.two import Fortran2003
 
+from psyclone.domain.lfric import LFRicConstants
 from psyclone.domain.lfric.kernel import OperatorArgMetadata
 
 
+def function_space_error(attribute):
+    '''Utility returning the error message expected when an invalid
+    function space is supplied for the named attribute. The list of
+    valid spaces is taken from LFRicConstants so that these tests do
+    not need updating if that list is extended or reordered.
+
+    :param str attribute: the name of the attribute being set.
+
+    :returns: the expected error message.
+    :rtype: str
+
+    '''
+    const = LFRicConstants()
+    return (f"The '{attribute}' metadata should be a recognised value "
+            f"(one of {const.VALID_FUNCTION_SPACE_NAMES}) "
+            f"but found 'invalid'.")
+
+
 def test_create():
     '''Test that an instance of OperatorArgMetadata can be created
     successfully.
@@ -57,40 +76,17 @@ def test_create():
     assert operator_arg._function_space_from == "w1"
 
 
-def test_init_invalid():
-    '''Test that invalid function spaces supplied to the constructor raise
-    the expected exceptions.
+@pytest.mark.parametrize("attribute, constructor_args", [
+    ("function_space_to", ["GH_REAL", "GH_READ", "invalid", "W1"]),
+    ("function_space_from", ["GH_REAL", "GH_READ", "W0", "invalid"])])
+def test_init_invalid(attribute, constructor_args):
+    '''Test that an invalid function space supplied to the constructor
+    raises the expected exception.
 
     '''
     with pytest.raises(ValueError) as info:
-        _ = OperatorArgMetadata("GH_REAL", "GH_READ", "invalid", "W1")
-    assert ("The 'function_space_to' metadata should be a recognised value "
-            "(one of ['w3', 'wtheta', 'w2v', 'w2vtrace', 'w2broken', 'w0', "
-            "'w1', 'w2', 'w2trace', 'w2h', 'w2htrace', 'any_w2', 'wchi', "
-            "'any_space_1', 'any_space_2', 'any_space_3', 'any_space_4', "
-            "'any_space_5', 'any_space_6', 'any_space_7', 'any_space_8', "
-            "'any_space_9', 'any_space_10', 'any_discontinuous_space_1', "
-            "'any_discontinuous_space_2', 'any_discontinuous_space_3', "
-            "'any_discontinuous_space_4', 'any_discontinuous_space_5', "
-            "'any_discontinuous_space_6', 'any_discontinuous_space_7', "
-            "'any_discontinuous_space_8', 'any_discontinuous_space_9', "
-            "'any_discontinuous_space_10']) but found 'invalid'."
-            in str(info.value))
-
-    with pytest.raises(ValueError) as info:
-        _ = OperatorArgMetadata("GH_REAL", "GH_READ", "W0", "invalid")
-    assert ("The 'function_space_from' metadata should be a recognised value "
-            "(one of ['w3', 'wtheta', 'w2v', 'w2vtrace', 'w2broken', 'w0', "
-            "'w1', 'w2', 'w2trace', 'w2h', 'w2htrace', 'any_w2', 'wchi', "
-            "'any_space_1', 'any_space_2', 'any_space_3', 'any_space_4', "
-            "'any_space_5', 'any_space_6', 'any_space_7', 'any_space_8', "
-            "'any_space_9', 'any_space_10', 'any_discontinuous_space_1', "
-            "'any_discontinuous_space_2', 'any_discontinuous_space_3', "
-            "'any_discontinuous_space_4', 'any_discontinuous_space_5', "
-            "'any_discontinuous_space_6', 'any_discontinuous_space_7', "
-            "'any_discontinuous_space_8', 'any_discontinuous_space_9', "
-            "'any_discontinuous_space_10']) but found 'invalid'."
-            in str(info.value))
+        _ = OperatorArgMetadata(*constructor_args)
+    assert function_space_error(attribute) in str(info.value)
 
 
 def test_get_metadata():
@@ -110,10 +106,15 @@ def test_get_metadata():
     assert function_space_from == "W1"
 
 
-def test_fortran_string():
-    '''Test that the fortran_string method works as expected.'''
+@pytest.mark.parametrize("fortran_string", [
+    "arg_type(GH_OPERATOR, GH_REAL, GH_READ, W0, W1)",
+    "arg_type(GH_OPERATOR, GH_REAL, GH_WRITE, W1, W2)",
+    "arg_type(GH_OPERATOR, GH_REAL, GH_READWRITE, W2, W3)"])
+def test_fortran_string(fortran_string):
+    '''Test that metadata created from a Fortran string is written back
+    out unchanged by the fortran_string method.
 
-    fortran_string = "arg_type(GH_OPERATOR, GH_REAL, GH_READ, W0, W1)"
+    '''
     operator_arg = OperatorArgMetadata.create_from_fortran_string(
         fortran_string)
     result = operator_arg.fortran_string()
@@ -139,49 +140,20 @@ def test_check_access():
             "'invalid'." in str(info.value))
 
 
-def test_setter_getter():
-    '''Test that the two function space setters and getters work as
-    expected, including raising exceptions if values are invalid.
+@pytest.mark.parametrize("attribute, value", [
+    ("function_space_to", "w2"), ("function_space_from", "w3")])
+def test_setter_getter(attribute, value):
+    '''Test that each function space setter and getter works as expected,
+    including raising an exception if the value is invalid.
 
     '''
     operator_arg = OperatorArgMetadata("GH_REAL", "GH_READ", "W0", "W1")
 
     with pytest.raises(ValueError) as info:
-        operator_arg.function_space_to = "invalid"
-    assert ("The 'function_space_to' metadata should be a recognised value "
-            "(one of ['w3', 'wtheta', 'w2v', 'w2vtrace', 'w2broken', 'w0', "
-            "'w1', 'w2', 'w2trace', 'w2h', 'w2htrace', 'any_w2', 'wchi', "
-            "'any_space_1', 'any_space_2', 'any_space_3', 'any_space_4', "
-            "'any_space_5', 'any_space_6', 'any_space_7', 'any_space_8', "
-            "'any_space_9', 'any_space_10', 'any_discontinuous_space_1', "
-            "'any_discontinuous_space_2', 'any_discontinuous_space_3', "
-            "'any_discontinuous_space_4', 'any_discontinuous_space_5', "
-            "'any_discontinuous_space_6', 'any_discontinuous_space_7', "
-            "'any_discontinuous_space_8', 'any_discontinuous_space_9', "
-            "'any_discontinuous_space_10']) but found 'invalid'."
-            in str(info.value))
-
-    operator_arg.function_space_to = "w2"
-    assert operator_arg.function_space_to == "w2"
-    operator_arg.function_space_to = "W2"
-    assert operator_arg.function_space_to == "w2"
+        setattr(operator_arg, attribute, "invalid")
+    assert function_space_error(attribute) in str(info.value)
 
-    with pytest.raises(ValueError) as info:
-        operator_arg.function_space_from = "invalid"
-    assert ("The 'function_space_from' metadata should be a recognised value "
-            "(one of ['w3', 'wtheta', 'w2v', 'w2vtrace', 'w2broken', 'w0', "
-            "'w1', 'w2', 'w2trace', 'w2h', 'w2htrace', 'any_w2', 'wchi', "
-            "'any_space_1', 'any_space_2', 'any_space_3', 'any_space_4', "
-            "'any_space_5', 'any_space_6', 'any_space_7', 'any_space_8', "
-            "'any_space_9', 'any_space_10', 'any_discontinuous_space_1', "
-            "'any_discontinuous_space_2', 'any_discontinuous_space_3', "
-            "'any_discontinuous_space_4', 'any_discontinuous_space_5', "
-            "'any_discontinuous_space_6', 'any_discontinuous_space_7', "
-            "'any_discontinuous_space_8', 'any_discontinuous_space_9', "
-            "'any_discontinuous_space_10']) but found 'invalid'."
-            in str(info.value))
-
-    operator_arg.function_space_from = "w3"
-    assert operator_arg.function_space_from == "w3"
-    operator_arg.function_space_from = "W3"
-    assert operator_arg.function_space_from == "w3"
+    setattr(operator_arg, attribute, value)
+    assert getattr(operator_arg, attribute) == value
+    setattr(operator_arg, attribute, value.upper())
+    assert getattr(operator_arg, attribute) == value
@@ -80,6 +80,12 @@ def test_singleton(monkeypatch):
     assert ("Unknown LFRic type 'does_not_exist'. Valid values are "
             in str(err.value))
 
+    # A non-string name must raise the same InternalError (sys.intern()
+    # raises a TypeError for it rather than the lookup a KeyError):
+    with pytest.raises(InternalError) as err:
+        LFRicTypes(1)
+    assert "Unknown LFRic type '1'. Valid values are " in str(err.value)
+
 
 def test_constants_mod():
     '''Test the generated module symbol and its argument symbols are
@@ -99,13 +105,18 @@ def test_constants_mod():
 
 
 # Generic scalars
-@pytest.mark.parametrize("type_name, symbol_name, intrinsic, precision_name", [
+GENERIC_SCALAR_CASES = [
     ("LFRicIntegerScalarDataType", "LFRicIntegerScalarDataSymbol",
      ScalarType.Intrinsic.INTEGER, "I_DEF"),
     ("LFRicRealScalarDataType", "LFRicRealScalarDataSymbol",
      ScalarType.Intrinsic.REAL, "R_DEF"),
     ("LFRicLogicalScalarDataType", "LFRicLogicalScalarDataSymbol",
-     ScalarType.Intrinsic.BOOLEAN, "L_DEF")])
+     ScalarType.Intrinsic.BOOLEAN, "L_DEF")]
+
+
+@pytest.mark.parametrize("type_name, symbol_name, intrinsic, precision_name",
+                         GENERIC_SCALAR_CASES,
+                         ids=[case[0] for case in GENERIC_SCALAR_CASES])
 def test_generic_scalars(type_name, symbol_name, intrinsic,
                          precision_name):
     '''Test the generated generic scalar datatypes and symbols are created
@@ -193,7 +204,7 @@ def test_specific_scalar_types_init_args():
 
 
 # Specific scalar symbols
-@pytest.mark.parametrize("symbol_name, generic_symbol_name, attribute_map", [
+SPECIFIC_SCALAR_SYMBOL_CASES = [
     ("CellPositionDataSymbol", "LFRicIntegerScalarDataSymbol", {}),
     ("MeshHeightDataSymbol", "LFRicIntegerScalarDataSymbol", {}),
     ("NumberOfCellsDataSymbol", "LFRicIntegerScalarDataSymbol", {}),
@@ -205,7 +216,13 @@ def test_specific_scalar_types_init_args():
     ("NumberOfQrPointsInXyDataSymbol", "LFRicIntegerScalarDataSymbol", {}),
     ("NumberOfQrPointsInZDataSymbol", "LFRicIntegerScalarDataSymbol", {}),
     ("NumberOfQrPointsInFacesDataSymbol", "LFRicIntegerScalarDataSymbol", {}),
-    ("NumberOfQrPointsInEdgesDataSymbol", "LFRicIntegerScalarDataSymbol", {})])
+    ("NumberOfQrPointsInEdgesDataSymbol", "LFRicIntegerScalarDataSymbol", {})]
+
+
+@pytest.mark.parametrize(
+    "symbol_name, generic_symbol_name, attribute_map",
+    SPECIFIC_SCALAR_SYMBOL_CASES,
+    ids=[case[0] for case in SPECIFIC_SCALAR_SYMBOL_CASES])
 def test_specific_scalar_symbols(symbol_name, generic_symbol_name,
                                  attribute_map):
     '''Test the generated specific scalar symbols are
@@ -227,11 +244,9 @@ def test_specific_scalar_symbols(symbol_name, generic_symbol_name,
     assert lfric_symbol.interface.access == ArgumentInterface.Access.READ
 
 
-# Specific scalar datatypes
-@pytest.mark.parametrize(
-    "data_type_name, symbol_name, scalar_type_name, dims_args,"
-    "attribute_map",
-    [("RealFieldDataType", "RealFieldDataSymbol",
+# Specific array datatypes
+ARRAY_CASES = [
+    ("RealFieldDataType", "RealFieldDataSymbol",
       "LFRicRealScalarDataType",
       [("NumberOfUniqueDofsDataSymbol", "ndofs", "w0")], {"fs": "w0"}),
      ("IntegerFieldDataType", "IntegerFieldDataSymbol",
@@ -296,7 +311,13 @@ def test_specific_scalar_symbols(symbol_name, generic_symbol_name,
       [("NumberOfQrPointsInFacesDataSymbol", "qr")], {}),
      ("QrWeightsInEdgesDataType", "QrWeightsInEdgesDataSymbol",
       "LFRicRealScalarDataType",
-      [("NumberOfQrPointsInEdgesDataSymbol", "qr")], {})])
+      [("NumberOfQrPointsInEdgesDataSymbol", "qr")], {})]
+
+
+@pytest.mark.parametrize(
+    "data_type_name, symbol_name, scalar_type_name, dims_args,"
+    "attribute_map",
+    ARRAY_CASES, ids=[case[0] for case in ARRAY_CASES])
 def test_arrays(data_type_name, symbol_name, scalar_type_name,
                 dims_args, attribute_map):
     '''Test the generated array datatypes and datasymbols are created
@@ -368,14 +389,18 @@ def test_arrays_data_symbol_init_args():
 
 
 # Vector field-data data-symbols
-@pytest.mark.parametrize(
-    "symbol, parent_symbol, space, visibility",
-    [("RealVectorFieldDataSymbol", "RealFieldDataSymbol",
-      "w0", None),
-     ("IntegerVectorFieldDataSymbol", "IntegerFieldDataSymbol",
-      "w1", Symbol.Visibility.PUBLIC),
-     ("LogicalVectorFieldDataSymbol", "LogicalFieldDataSymbol",
-      "w2", Symbol.Visibility.PRIVATE)])
+VECTOR_FIELD_CASES = [
+    ("RealVectorFieldDataSymbol", "RealFieldDataSymbol",
+     "w0", None),
+    ("IntegerVectorFieldDataSymbol", "IntegerFieldDataSymbol",
+     "w1", Symbol.Visibility.PUBLIC),
+    ("LogicalVectorFieldDataSymbol", "LogicalFieldDataSymbol",
+     "w2", Symbol.Visibility.PRIVATE)]
+
+
+@pytest.mark.parametrize("symbol, parent_symbol, space, visibility",
+                         VECTOR_FIELD_CASES,
+                         ids=[case[0] for case in VECTOR_FIELD_CASES])
 def test_vector_fields(symbol, parent_symbol, space, visibility):
     '''Test the generated vector field datasymbols are created
     correctly. These are straight subclasses of the equivalent field
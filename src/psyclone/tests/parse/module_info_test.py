@@ -36,11 +36,15 @@
 
 '''Module containing tests for the ModuleInfo class.'''
 
+import os
+import weakref
+
 import pytest
 
 from fparser.two import Fortran2003
 
 from psyclone.parse import ModuleInfo, ModuleInfoError, ModuleManager
+from psyclone.parse import module_info
 from psyclone.psyir.nodes import Container, FileContainer
 from psyclone.tests.utilities import get_base_path
 
@@ -147,6 +151,150 @@ def test_mod_info_get_used_modules():
         assert mod_info.get_used_symbols_from_modules()[module] == set()
 
 
+# -----------------------------------------------------------------------------
+@pytest.mark.usefixtures("change_into_tmpdir", "clear_module_manager_instance")
+def test_mod_info_used_modules_cache(monkeypatch):
+    '''Tests that the import information is cached on disk and re-used for
+    an unchanged file without parsing it again.
+
+    '''
+    monkeypatch.setattr(module_info, "_USE_CACHE_FILE",
+                        os.path.join(os.getcwd(), "use_stmts.json"))
+    monkeypatch.setattr(module_info, "_use_cache", None)
+    monkeypatch.setattr(module_info, "_use_cache_dirty", False)
+    with open("x_mod.f90", "w", encoding="utf-8") as file_out:
+        file_out.write("module x_mod\n"
+                       "use a_mod, only: a_sym\n"
+                       "end module x_mod\n")
+    mod_info = ModuleInfo("x_mod", "x_mod.f90")
+    assert mod_info.get_used_modules() == {"a_mod"}
+    # The save is batched: nothing is written until _save_use_cache runs
+    # (normally at interpreter exit).
+    assert not os.path.exists("use_stmts.json")
+    assert module_info._use_cache_dirty
+    module_info._save_use_cache()
+    assert os.path.exists("use_stmts.json")
+    assert not module_info._use_cache_dirty
+
+    # A new ModuleInfo for the same (unchanged) file gets the information
+    # from the on-disk cache without parsing the file:
+    monkeypatch.setattr(ModuleInfo, "_instances",
+                        weakref.WeakValueDictionary())
+    monkeypatch.setattr(module_info, "_use_cache", None)
+    mod_info2 = ModuleInfo("x_mod", "x_mod.f90")
+    assert mod_info2 is not mod_info
+    assert mod_info2.get_used_modules() == {"a_mod"}
+    assert mod_info2.get_used_symbols_from_modules() == {"a_mod": {"a_sym"}}
+    assert mod_info2._parse_tree is None
+
+    # With the on-disk cache disabled the information is extracted from
+    # the source as before:
+    monkeypatch.setattr(ModuleInfo, "_instances",
+                        weakref.WeakValueDictionary())
+    monkeypatch.setenv("PSYCLONE_PARSE_CACHE", "0")
+    mod_info3 = ModuleInfo("x_mod", "x_mod.f90")
+    assert mod_info3.get_used_modules() == {"a_mod"}
+    assert mod_info3.get_used_symbols_from_modules() == {"a_mod": {"a_sym"}}
+
+
+# -----------------------------------------------------------------------------
+@pytest.mark.usefixtures("change_into_tmpdir", "clear_module_manager_instance")
+def test_mod_info_use_statement_fast_path(monkeypatch):
+    '''Tests that the lexical extraction of use statements gives the same
+    results as the fparser-based extraction, and that unusual forms of use
+    statement fall back to fparser.
+
+    '''
+    # Make sure the on-disk cache does not interfere with this test:
+    monkeypatch.setenv("PSYCLONE_PARSE_CACHE", "0")
+    source = '''module y_mod
+    use a_mod, only: a_sym
+    use B_Mod
+    use, intrinsic :: iso_fortran_env
+    use, non_intrinsic :: c_mod, only: x, y
+    use d_mod, only : loc => remote
+    use e_mod, only: a, &
+         b, c
+    end module y_mod
+    '''
+    extract_use_information = module_info._extract_use_information
+    use_info = extract_use_information(source)
+    assert use_info is not None
+    with open("y_mod.f90", "w", encoding="utf-8") as file_out:
+        file_out.write(source)
+    mod_info = ModuleInfo("y_mod", "y_mod.f90")
+    # Force the fparser-based extraction and compare the results:
+    monkeypatch.setattr(module_info, "_extract_use_information",
+                        lambda _: None)
+    mod_info._extract_import_information()
+    assert use_info == (mod_info._used_modules,
+                        mod_info._used_symbols_from_module)
+    assert mod_info._used_modules == {"a_mod", "B_Mod", "c_mod", "d_mod",
+                                      "e_mod"}
+    assert mod_info._used_symbols_from_module["d_mod"] == {"loc => remote"}
+    assert mod_info._used_symbols_from_module["e_mod"] == {"a", "b", "c"}
+    # Restore the real _extract_use_information for the checks below:
+    monkeypatch.setattr(module_info, "_extract_use_information",
+                        extract_use_information)
+
+    # Use statements that the regular expressions do not handle must
+    # result in a fallback to fparser:
+    for stmt in ["use a_mod, only: operator(+)",
+                 "use a_mod, x => y",
+                 "use a_mod, only:",
+                 "use := invalid"]:
+        assert module_info._extract_use_information(
+            f"module z_mod\n{stmt}\nend module z_mod\n") is None
+
+    # A '&' at the end of a comment is not a continuation and must not
+    # swallow the following line:
+    use_info = module_info._extract_use_information(
+        "module z_mod\n"
+        "use a_mod ! note &\n"
+        "use b_mod\n"
+        "! a comment ending in a continuation character &\n"
+        "use c_mod\n"
+        "end module z_mod\n")
+    assert use_info[0] == {"a_mod", "b_mod", "c_mod"}
+
+    # A ';' may hide a use statement inside a compound line, and a string
+    # continued over a line break cannot be scanned lexically - both must
+    # fall back to fparser:
+    assert module_info._extract_use_information(
+        "module z_mod; use a_mod\nend module z_mod\n") is None
+    assert module_info._extract_use_information(
+        "module z_mod\n"
+        "character(*), parameter :: str = 'a string &\n"
+        "     &that continues'\n"
+        "end module z_mod\n") is None
+
+
+# -----------------------------------------------------------------------------
+@pytest.mark.usefixtures("change_into_tmpdir", "clear_module_manager_instance")
+def test_mod_info_use_in_block_construct(monkeypatch):
+    '''Tests that the fparser-based extraction finds a use statement in the
+    specification part of an F2008 BLOCK construct.
+
+    '''
+    monkeypatch.setenv("PSYCLONE_PARSE_CACHE", "0")
+    with open("blk_mod.f90", "w", encoding="utf-8") as file_out:
+        file_out.write("module blk_mod\n"
+                       "contains\n"
+                       "subroutine s()\n"
+                       "  block\n"
+                       "    use a_mod, only: x\n"
+                       "    integer :: y\n"
+                       "    y = x\n"
+                       "  end block\n"
+                       "end subroutine s\n"
+                       "end module blk_mod\n")
+    mod_info = ModuleInfo("blk_mod", "blk_mod.f90")
+    # Force the fparser-based extraction:
+    monkeypatch.setattr(module_info, "_extract_use_information",
+                        lambda _: None)
+    assert mod_info.get_used_symbols_from_modules() == {"a_mod": {"x"}}
+
+
 # -----------------------------------------------------------------------------
 @pytest.mark.usefixtures("change_into_tmpdir", "clear_module_manager_instance",
                          "mod_man_test_setup_directories")
@@ -306,7 +454,7 @@ def test_module_info_contains_routine():
 # -----------------------------------------------------------------------------
 @pytest.mark.usefixtures("change_into_tmpdir", "clear_module_manager_instance",
                          "mod_man_test_setup_directories")
-def test_module_info_extract_import_information_error():
+def test_module_info_extract_import_information_error(monkeypatch):
     '''Test handling of files that cannot be parsed in
     _extract_import_information. This relies on the directories and file setup
     my `mod_man_test_setup_directories`, which will create a file
@@ -322,6 +470,10 @@ def test_module_info_extract_import_information_error():
 
     assert mod_info._used_modules is None
     assert mod_info._used_symbols_from_module is None
+    # Disable the lexical fast path so that the file is parsed (and the
+    # syntax error is found) by fparser:
+    monkeypatch.setattr(module_info, "_extract_use_information",
+                        lambda source: None)
     mod_info._extract_import_information()
     # Make sure the internal attributes are set to not None to avoid
     # trying to parse them again later
@@ -351,11 +351,12 @@ def test_gen_typedecl_validation(fortran_writer, monkeypatch):
         fortran_writer.gen_typedecl("hello")
     assert ("gen_typedecl expects a DataTypeSymbol as argument but got: 'str'"
             in str(err.value))
-    # UnsupportedType is abstract so we create an UnsupportedFortranType and
-    # then monkeypatch it.
-    tsymbol = DataTypeSymbol("my_type", UnsupportedFortranType(
+    # UnsupportedType is abstract so create a like-named concrete subclass
+    # (it cannot be an UnsupportedFortranType as that is handled).
+    fake_cls = type("UnsupportedType", (UnsupportedType,),
+                    {"__str__": lambda self: "UnsupportedType"})
+    tsymbol = DataTypeSymbol("my_type", fake_cls(
         "type my_type\nend type my_type"))
-    monkeypatch.setattr(tsymbol.datatype, "__class__", UnsupportedType)
 
     with pytest.raises(VisitorError) as err:
         fortran_writer.gen_typedecl(tsymbol)
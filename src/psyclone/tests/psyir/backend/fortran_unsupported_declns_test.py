@@ -57,10 +57,11 @@ def test_fw_unsupported_decln_error(monkeypatch, fortran_writer):
     ''' Check that the FortranWriter raises the expected error if it
     encounters an UnsupportedType that is not an UnsupportedFortranType. '''
     # We can't create an UnsupportedType() object directly as it is abstract.
-    # Therefore we create a symbol of UnsupportedFortranType and then
-    # monkeypatch it.
-    sym = DataSymbol("b", UnsupportedFortranType("int b;"))
-    monkeypatch.setattr(sym.datatype, "__class__", UnsupportedType)
+    # Therefore we create a like-named concrete subclass (which must not be
+    # an UnsupportedFortranType as that is supported).
+    fake_cls = type("UnsupportedType", (UnsupportedType,),
+                    {"__str__": lambda self: "UnsupportedType"})
+    sym = DataSymbol("b", fake_cls("int b;"))
     with pytest.raises(VisitorError) as err:
         fortran_writer.gen_vardecl(sym)
     assert ("DataSymbol 'b' is of 'UnsupportedType' type. This is not "
@@ -37,8 +37,11 @@
 
 ''' Performs py.test tests on the Fortran PSyIR front-end '''
 
+import os
+
 import pytest
 from fparser.two import Fortran2003
+from psyclone.psyir.frontend import fortran
 from psyclone.psyir.frontend.fortran import FortranReader
 from psyclone.psyir.frontend.fparser2 import Fparser2Reader
 from psyclone.psyir.nodes import (
@@ -92,6 +95,36 @@ def test_fortran_psyir_from_source():
     assert isinstance(subroutine, Routine)
 
 
+def test_fortran_psyir_from_source_cache(fortran_writer, monkeypatch):
+    ''' Test that psyir_from_source caches a prototype of the generated
+    PSyIR and serves independent copies of it on subsequent calls. '''
+    monkeypatch.setattr(FortranReader, "_source_cache",
+                        FortranReader._source_cache.__class__())
+    fortran_reader = FortranReader()
+    first = fortran_reader.psyir_from_source(CODE)
+    assert len(FortranReader._source_cache) == 1
+    # A second call with the same source is served from the cache and
+    # returns an independent, equivalent tree.
+    second = fortran_reader.psyir_from_source(CODE)
+    assert len(FortranReader._source_cache) == 1
+    assert second is not first
+    assert fortran_writer(second) == fortran_writer(first)
+    # Different source results in a new entry.
+    fortran_reader.psyir_from_source(CODE.replace("a + 1", "a + 2"))
+    assert len(FortranReader._source_cache) == 2
+    # The cache is bounded: when full, the least-recently used entry is
+    # evicted.
+    monkeypatch.setattr(fortran, "_SOURCE_CACHE_SIZE", 2)
+    fortran_reader.psyir_from_source(CODE.replace("a + 1", "a + 3"))
+    assert len(FortranReader._source_cache) == 2
+    # Setting the size to zero disables the cache.
+    monkeypatch.setattr(fortran, "_SOURCE_CACHE_SIZE", 0)
+    monkeypatch.setattr(FortranReader, "_source_cache",
+                        FortranReader._source_cache.__class__())
+    fortran_reader.psyir_from_source(CODE)
+    assert len(FortranReader._source_cache) == 0
+
+
 def test_fortran_psyir_from_source_fixed_form():
     '''
     Test we parse also fixed-form fortran code when enabling the right
@@ -144,6 +177,30 @@ def test_fortran_psyir_from_expression(fortran_reader):
     assert a_symbol is a_symbol_table
 
 
+def test_fortran_psyir_from_expression_cache(fortran_reader, monkeypatch):
+    ''' Test that literal-only expressions are cached and served as
+    independent copies, but that kind-suffixed literals are not cached:
+    their precision is a DataSymbol resolved from the caller's symbol
+    table, so a cached copy would leak one caller's symbol into
+    another caller's PSyIR. '''
+    monkeypatch.setattr(FortranReader, "_expression_cache", {})
+    first = fortran_reader.psyir_from_expression("1.0 + 2.0")
+    assert "1.0 + 2.0" in FortranReader._expression_cache
+    second = fortran_reader.psyir_from_expression("1.0 + 2.0")
+    assert second is not first
+
+    # Callers with different symbol tables must each get a literal whose
+    # precision is their own 'wp' symbol.
+    table1 = Routine("one").symbol_table
+    expr1 = fortran_reader.psyir_from_expression("1.0_wp", table1)
+    assert "1.0_wp" not in FortranReader._expression_cache
+    assert expr1.datatype.precision is table1.lookup("wp")
+    table2 = Routine("two").symbol_table
+    expr2 = fortran_reader.psyir_from_expression("1.0_wp", table2)
+    assert expr2.datatype.precision is table2.lookup("wp")
+    assert expr2.datatype.precision is not expr1.datatype.precision
+
+
 def test_fortran_psyir_from_expression_invalid(fortran_reader):
     ''' Test that the psyir_from_expression method raises the expected
     error when given something that is not an expression. '''
@@ -224,3 +281,87 @@ def test_fortran_psyir_from_file(fortran_reader, tmpdir_factory):
     with pytest.raises(IOError) as err:
         fortran_reader.psyir_from_file(filename)
     assert "No such file or directory: '" + str(filename) in str(err.value)
+
+
+def test_fortran_psyir_from_files(fortran_reader, tmpdir, monkeypatch):
+    ''' Test that the psyir_from_files method parses each of the supplied
+    files to PSyIR, priming the parse cache in parallel. '''
+    cache_dir = str(tmpdir.join("cache"))
+    monkeypatch.setattr(fortran, "_CACHE_DIR", cache_dir)
+    filenames = []
+    for idx in range(2):
+        filename = str(tmpdir.join(f"testfile{idx}.f90"))
+        with open(filename, "w", encoding='utf-8') as wfile:
+            wfile.write(f"subroutine sub{idx}(a)\n"
+                        f"  integer, dimension(:), intent(inout) :: a\n"
+                        f"  a = a + {idx}\n"
+                        f"end subroutine sub{idx}\n")
+        filenames.append(filename)
+
+    result = fortran_reader.psyir_from_files(filenames)
+    assert sorted(result.keys()) == sorted(filenames)
+    for idx, filename in enumerate(filenames):
+        file_container = result[filename]
+        assert isinstance(file_container, FileContainer)
+        assert file_container.children[0].name == f"sub{idx}"
+    # Both files now have an entry in the parse cache.
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_fortran_psyir_from_files_cpu_count_none(fortran_reader, tmpdir,
+                                                 monkeypatch):
+    ''' Test that psyir_from_files falls back to serial parsing (rather
+    than raising a TypeError) when os.cpu_count() returns None, i.e. when
+    the number of CPUs cannot be determined. '''
+    monkeypatch.setattr(os, "cpu_count", lambda: None)
+    filenames = []
+    for idx in range(2):
+        filename = str(tmpdir.join(f"testfile{idx}.f90"))
+        with open(filename, "w", encoding='utf-8') as wfile:
+            wfile.write(f"subroutine sub{idx}()\n"
+                        f"end subroutine sub{idx}\n")
+        filenames.append(filename)
+    result = fortran_reader.psyir_from_files(filenames)
+    for idx, filename in enumerate(filenames):
+        assert result[filename].children[0].name == f"sub{idx}"
+
+
+def test_fortran_psyir_from_file_cache(fortran_reader, fortran_writer,
+                                       tmpdir, monkeypatch):
+    ''' Test that psyir_from_file caches the fparser tree on disk and that
+    subsequent calls re-use the cached tree. '''
+    cache_dir = str(tmpdir.join("cache"))
+    monkeypatch.setattr(fortran, "_CACHE_DIR", cache_dir)
+    filename = str(tmpdir.join("testfile.f90"))
+    with open(filename, "w", encoding='utf-8') as wfile:
+        wfile.write(CODE)
+
+    # With the cache disabled no cache entry is created.
+    monkeypatch.setenv("PSYCLONE_PARSE_CACHE", "0")
+    fortran_reader.psyir_from_file(filename)
+    assert not os.path.exists(cache_dir)
+
+    # The first (cache-miss) call creates a cache entry...
+    monkeypatch.delenv("PSYCLONE_PARSE_CACHE")
+    first = fortran_reader.psyir_from_file(filename)
+    assert len(os.listdir(cache_dir)) == 1
+
+    # ...and a second (cache-hit) call produces equivalent PSyIR without
+    # adding a new entry.
+    second = fortran_reader.psyir_from_file(filename)
+    assert len(os.listdir(cache_dir)) == 1
+    assert fortran_writer(second) == fortran_writer(first)
+
+    # A corrupt cache entry is ignored (and replaced).
+    entry = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+    with open(entry, "wb") as cfile:
+        cfile.write(b"not a pickle")
+    third = fortran_reader.psyir_from_file(filename)
+    assert fortran_writer(third) == fortran_writer(first)
+
+    # Changing the file contents results in a new cache entry.
+    with open(filename, "w", encoding='utf-8') as wfile:
+        wfile.write(CODE.replace("a + 1", "a + 2"))
+    fourth = fortran_reader.psyir_from_file(filename)
+    assert len(os.listdir(cache_dir)) == 2
+    assert "a + 2" in fortran_writer(fourth)
@@ -145,6 +145,26 @@ def test_is_bound_validate_index(fortran_reader):
             "than the number of dimensions '1'." in str(info.value))
 
 
+def test_validate_index_aos(fortran_reader):
+    '''Test that _validate_index counts only the index children of an
+    ArrayOfStructures access: its first child is the Member being
+    accessed, not an index.'''
+    code = (
+        "subroutine test()\n"
+        "use my_mod\n"
+        "type(my_type), dimension(10) :: g\n"
+        "g(:)%data = 0.0\n"
+        "end subroutine\n")
+    psyir = fortran_reader.psyir_from_source(code)
+    aos_ref = psyir.walk(Assignment)[0].lhs
+    aos_ref._validate_index(0)
+    with pytest.raises(ValueError) as info:
+        aos_ref._validate_index(1)
+    assert ("In 'ArrayOfStructuresReference' 'g' the specified index '1' "
+            "must be less than the number of dimensions '1'."
+            in str(info.value))
+
+
 @pytest.mark.parametrize("bounds,lower,upper", [
     (":", True, True), ("2:", False, True), (":n-1", True, False),
     ("2:n-1", False, False)])
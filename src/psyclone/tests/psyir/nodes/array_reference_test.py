@@ -468,13 +468,6 @@ def test_array_indices():
                                              ArrayType(REAL_TYPE, [10])),
                                   [one])
     assert array.indices == [one]
-    # Add an invalid child
-    array._children = [one.copy(), "hello"]
-    with pytest.raises(InternalError) as err:
-        _ = array.indices
-    assert ("ArrayReference malformed or incomplete: child 1 of array 'test' "
-            "must be a psyir.nodes.DataNode or Range representing an array-"
-            "index expression but found 'str'" in str(err.value))
     # Remove the children altogether
     array._children = []
     with pytest.raises(InternalError) as err:
@@ -1712,6 +1712,46 @@ def test_walk_depth(fortran_reader):
     assert len(psyir.walk(Loop, depth=depth)) == 0
 
 
+def test_iwalk(fortran_reader):
+    '''Test the iwalk method of the Node class.'''
+
+    code = '''subroutine test_iwalk()
+    integer :: i, j, k
+    integer :: arr(2,2,2)
+
+    do i = 1, 2
+      do j = 1, 2
+        do k = 1, 2
+          if (k == 1) then
+              arr(i,j,k) = 0
+          else
+              arr(i,j,k) = -1
+          end if
+        end do
+      end do
+    end do
+    end subroutine'''
+
+    psyir = fortran_reader.psyir_from_source(code)
+
+    # iwalk yields exactly the nodes that walk returns, in the same order,
+    # for each combination of my_type, stop_type and depth.
+    for kwargs in [{}, {"stop_type": Loop},
+                   {"depth": psyir.depth + 4}]:
+        eager = psyir.walk((Loop, Assignment), **kwargs)
+        lazy = psyir.iwalk((Loop, Assignment), **kwargs)
+        # A generator is returned, not a list.
+        assert not isinstance(lazy, list)
+        lazy = list(lazy)
+        assert len(lazy) == len(eager)
+        assert all(node1 is node2 for node1, node2 in zip(lazy, eager))
+
+    # The traversal can be abandoned early.
+    first = next(psyir.iwalk(Assignment), None)
+    assert first is psyir.walk(Assignment)[0]
+    assert next(psyir.iwalk(Return), None) is None
+
+
 def test_get_sibling_lists(fortran_reader):
     '''Tests the get_sibling_lists functionality.'''
 
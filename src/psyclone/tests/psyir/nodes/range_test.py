@@ -202,6 +202,19 @@ def test_range_out_of_order_setter():
     assert len(erange.children) == 3
 
 
+def test_range_is_unit_step():
+    ''' Check the is_unit_step property of a Range node. '''
+    erange = Range.create(Literal("10", INTEGER_SINGLE_TYPE),
+                          Literal("20", INTEGER_SINGLE_TYPE))
+    # The default step is the integer literal 1.
+    assert erange.is_unit_step
+    erange.step = Literal("2", INTEGER_SINGLE_TYPE)
+    assert not erange.is_unit_step
+    # A non-Literal step cannot be known to be unity.
+    erange.step = Reference(DataSymbol("istep", INTEGER_SINGLE_TYPE))
+    assert not erange.is_unit_step
+
+
 def test_range_str():
     ''' Check that node_str and str work correctly for a Range node. '''
     erange = Range()